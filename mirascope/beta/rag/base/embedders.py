@@ -1,7 +1,8 @@
 """Embedders for the RAG module."""
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import ClassVar, Generic, TypeVar
+from typing import TYPE_CHECKING, ClassVar, Generic, TypeVar
 
 from pydantic import BaseModel
 
@@ -9,6 +10,10 @@ from .config import BaseConfig
 from .embedding_params import BaseEmbeddingParams
 from .embedding_response import BaseEmbeddingResponse
 
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
 BaseEmbeddingT = TypeVar("BaseEmbeddingT", bound=BaseEmbeddingResponse)
 
 
@@ -33,3 +38,105 @@ class BaseEmbedder(BaseModel, Generic[BaseEmbeddingT], ABC):
     async def embed_async(self, input: list[str]) -> BaseEmbeddingT:
         """Asynchronously call the embedder with a single input"""
         ...
+
+    def embed_batch(
+        self, inputs: list[str], *, batch_size: int = 96, max_concurrency: int = 16
+    ) -> list[list[float]] | list[list[int]]:
+        """Embeds `inputs` in concurrent batches and returns the embeddings in order.
+
+        This runs `embed_batch_async` in a new event loop, so it cannot be called from
+        inside a running event loop.
+        """
+        return asyncio.run(
+            self.embed_batch_async(
+                inputs, batch_size=batch_size, max_concurrency=max_concurrency
+            )
+        )
+
+    async def embed_batch_async(
+        self, inputs: list[str], *, batch_size: int = 96, max_concurrency: int = 16
+    ) -> list[list[float]] | list[list[int]]:
+        """Asynchronously embeds `inputs` in concurrent batches.
+
+        The inputs are split into batches of `batch_size` that are sent with at most
+        `max_concurrency` `embed_async` requests in flight at once. This speeds up
+        indexing against cloud endpoints that serve requests in parallel; providers that
+        queue requests (e.g. a local server) will not benefit.
+
+        Args:
+            inputs: The texts to embed.
+            batch_size: The maximum number of inputs to send in a single request.
+            max_concurrency: The maximum number of requests to run concurrently.
+
+        Returns:
+            The embeddings of `inputs`, in the same order as `inputs`.
+
+        Raises:
+            ValueError: if `batch_size` or `max_concurrency` is less than 1, or if a
+                batch's response contains no embeddings.
+        """
+        if batch_size < 1:
+            raise ValueError("`batch_size` must be at least 1.")
+        if max_concurrency < 1:
+            raise ValueError("`max_concurrency` must be at least 1.")
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _embed_batch(batch: list[str]) -> BaseEmbeddingT:
+            async with semaphore:
+                return await self.embed_async(batch)
+
+        responses = await asyncio.gather(
+            *(
+                _embed_batch(inputs[i : i + batch_size])
+                for i in range(0, len(inputs), batch_size)
+            )
+        )
+        embeddings: list = []
+        for i, response in enumerate(responses):
+            if response.embeddings is None:
+                raise ValueError(
+                    f"The response for the batch starting at input {i * batch_size} "
+                    "contains no embeddings."
+                )
+            embeddings.extend(response.embeddings)
+        return embeddings
+
+    def embed_numpy(
+        self,
+        inputs: list[str],
+        *,
+        normalize: bool = True,
+        dtype: "npt.DTypeLike" = "float16",
+    ) -> "np.ndarray":
+        """Embeds `inputs` into a contiguous `(len(inputs), dimensions)` NumPy array.
+
+        Requires `numpy` to be installed. Normalization happens in `float32` in a single
+        vectorized pass before casting to `dtype`, which defaults to `float16` to halve
+        the memory footprint when loading the embeddings into a vector index.
+
+        Args:
+            inputs: The texts to embed.
+            normalize: Whether to L2-normalize each embedding.
+            dtype: The floating point dtype of the returned array.
+
+        Returns:
+            The embeddings of `inputs` as rows of the array, in the same order.
+
+        Raises:
+            ValueError: if `dtype` is not a floating point dtype.
+        """
+        import numpy as np
+
+        dtype = np.dtype(dtype)
+        if not np.issubdtype(dtype, np.floating):
+            raise ValueError(
+                f"`dtype` must be a floating point dtype, got {dtype}. Casting "
+                "normalized embeddings to other dtypes would discard them."
+            )
+        if not inputs:
+            return np.empty((0, self.dimensions or 0), dtype=dtype)
+        embeddings = np.asarray(self.embed(inputs).embeddings, dtype=np.float32)
+        if normalize:
+            norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+            embeddings /= np.where(norms == 0, 1, norms)
+        return np.ascontiguousarray(embeddings, dtype=dtype)
@@ -1,6 +1,8 @@
 """The Mirascope Core Functionality."""
 
-from contextlib import suppress
+from importlib import import_module
+from types import ModuleType
+from typing import TYPE_CHECKING
 
 from . import base
 from .base import (
@@ -14,36 +16,54 @@ from .base import (
     ResponseModelConfigDict,
     merge_decorators,
     metadata,
+    parallel,
     prompt_template,
+    response_cache,
     toolkit_tool,
 )
 
-with suppress(ImportError):
-    from . import anthropic as anthropic
+if TYPE_CHECKING:
+    from . import (
+        anthropic,
+        azure,
+        cohere,
+        gemini,
+        groq,
+        litellm,
+        mistral,
+        openai,
+        vertex,
+    )
 
-with suppress(ImportError):
-    from . import cohere as cohere
-
-with suppress(ImportError):
-    from . import gemini as gemini
-
-with suppress(ImportError):
-    from . import groq as groq
+# Provider modules import their (often heavy) SDKs, so we only import a provider the
+# first time it's accessed rather than importing every installed provider up front.
+_PROVIDERS = {
+    "anthropic",
+    "azure",
+    "cohere",
+    "gemini",
+    "groq",
+    "litellm",
+    "mistral",
+    "openai",
+    "vertex",
+}
 
-with suppress(ImportError):
-    from . import litellm as litellm
 
-with suppress(ImportError):
-    from . import mistral as mistral
+def __getattr__(name: str) -> ModuleType:
+    if name in _PROVIDERS:
+        try:
+            return import_module(f".{name}", __name__)
+        except ImportError as e:
+            raise AttributeError(
+                f"module {__name__!r} has no attribute {name!r}"
+            ) from e
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-with suppress(ImportError):
-    from . import openai as openai
 
-with suppress(ImportError):
-    from . import vertex as vertex
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
 
-with suppress(ImportError):
-    from . import azure as azure
 
 __all__ = [
     "anthropic",
@@ -64,7 +84,9 @@ __all__ = [
     "metadata",
     "mistral",
     "openai",
+    "parallel",
     "prompt_template",
+    "response_cache",
     "ResponseModelConfigDict",
     "toolkit_tool",
     "vertex",
@@ -5,6 +5,7 @@ def calculate_cost(
     input_tokens: int | float | None,
     output_tokens: int | float | None,
     model: str = "claude-3-haiku-20240229",
+    cached_tokens: int | float | None = None,
 ) -> float | None:
     """Calculate the cost of a completion using the Anthropic API.
 
@@ -16,6 +17,9 @@ def calculate_cost(
     claude-3-haiku            $0.25 / 1M tokens   $1.25 / 1M tokens
     claude-3-sonnet           $3.00 / 1M tokens   $15.00 / 1M tokens
     claude-3-opus             $15.00 / 1M tokens   $75.00 / 1M tokens
+
+    Cached input tokens (cache reads) are reported separately from `input_tokens` and
+    are billed at 10% of the model's input price.
     """
     pricing = {
         "claude-instant-1.2": {
@@ -91,7 +95,8 @@ def calculate_cost(
         return None
 
     prompt_cost = input_tokens * model_pricing["prompt"]
+    cached_cost = (cached_tokens or 0) * model_pricing["prompt"] * 0.1
     completion_cost = output_tokens * model_pricing["completion"]
-    total_cost = prompt_cost + completion_cost
+    total_cost = prompt_cost + cached_cost + completion_cost
 
     return total_cost
@@ -20,7 +20,9 @@ from .message_param import (
 )
 from .messages import Messages
 from .metadata import Metadata
+from .parallel import parallel
 from .prompt import BasePrompt, metadata, prompt_template
+from .response_cache import response_cache
 from .response_model_config_dict import ResponseModelConfigDict
 from .stream import BaseStream
 from .structured_stream import BaseStructuredStream
@@ -53,7 +55,9 @@ __all__ = [
     "metadata",
     "Messages",
     "Metadata",
+    "parallel",
     "prompt_template",
+    "response_cache",
     "ResponseModelConfigDict",
     "TextPart",
     "ToolConfig",
@@ -2,7 +2,7 @@
 
 from collections.abc import AsyncIterable, Callable, Iterable
 from enum import Enum
-from functools import partial
+from functools import cache, partial
 from typing import TypeVar
 
 from pydantic import BaseModel
@@ -121,6 +121,43 @@ def call_factory(  # noqa: ANN202
             handling asynchronous streaming.
     """
 
+    # The inner decorators only depend on the provider-specific arguments above, so we
+    # construct each one lazily on first use and share it across every decorated
+    # function rather than rebuilding it on each `base_call` invocation.
+    @cache
+    def _create_decorator():  # noqa: ANN202
+        return create_factory(TCallResponse=TCallResponse, setup_call=setup_call)
+
+    @cache
+    def _stream_decorator():  # noqa: ANN202
+        return stream_factory(
+            TCallResponse=TCallResponse,
+            TStream=TStream,
+            setup_call=setup_call,
+            handle_stream=handle_stream,
+            handle_stream_async=handle_stream_async,
+        )
+
+    @cache
+    def _extract_decorator():  # noqa: ANN202
+        return extract_factory(
+            TCallResponse=TCallResponse,
+            TToolType=TToolType,
+            setup_call=setup_call,
+            get_json_output=get_json_output,
+        )
+
+    @cache
+    def _structured_stream_decorator():  # noqa: ANN202
+        return structured_stream_factory(
+            TCallResponse=TCallResponse,
+            TCallResponseChunk=TCallResponseChunk,
+            TStream=TStream,
+            TToolType=TToolType,
+            setup_call=setup_call,
+            get_json_output=get_json_output,
+        )
+
     def base_call(
         model: str,
         *,
@@ -178,14 +215,7 @@ def call_factory(  # noqa: ANN202
         if response_model:
             if stream:
                 return partial(
-                    structured_stream_factory(
-                        TCallResponse=TCallResponse,
-                        TCallResponseChunk=TCallResponseChunk,
-                        TStream=TStream,
-                        TToolType=TToolType,
-                        setup_call=setup_call,
-                        get_json_output=get_json_output,
-                    ),
+                    _structured_stream_decorator(),
                     model=model,
                     response_model=response_model,
                     json_mode=json_mode,
@@ -194,12 +224,7 @@ def call_factory(  # noqa: ANN202
                 )  # pyright: ignore [reportReturnType, reportCallIssue]
             else:
                 return partial(
-                    extract_factory(
-                        TCallResponse=TCallResponse,
-                        TToolType=TToolType,
-                        setup_call=setup_call,
-                        get_json_output=get_json_output,
-                    ),
+                    _extract_decorator(),
                     model=model,
                     response_model=response_model,
                     output_parser=output_parser,
@@ -210,13 +235,7 @@ def call_factory(  # noqa: ANN202
 
         if stream:
             return partial(
-                stream_factory(
-                    TCallResponse=TCallResponse,
-                    TStream=TStream,
-                    setup_call=setup_call,
-                    handle_stream=handle_stream,
-                    handle_stream_async=handle_stream_async,
-                ),
+                _stream_decorator(),
                 model=model,
                 tools=tools,
                 json_mode=json_mode,
@@ -225,7 +244,7 @@ def call_factory(  # noqa: ANN202
                 partial_tools=isinstance(stream, dict) and stream.get("partial_tools"),
             )  # pyright: ignore [reportReturnType, reportCallIssue]
         return partial(
-            create_factory(TCallResponse=TCallResponse, setup_call=setup_call),
+            _create_decorator(),
             model=model,
             tools=tools,
             output_parser=output_parser,
@@ -20,6 +20,11 @@ from .call_response import BaseCallResponse
 from .dynamic_config import BaseDynamicConfig
 from .messages import Messages
 from .prompt import prompt_template
+from .response_cache import (
+    cache_create,
+    cache_create_async,
+    claim_response_cache,
+)
 from .tool import BaseTool
 
 _BaseCallResponseT = TypeVar("_BaseCallResponseT", bound=BaseCallResponse)
@@ -160,6 +165,7 @@ def create_factory(  # noqa: ANN202
             async def inner_async(
                 *args: _P.args, **kwargs: _P.kwargs
             ) -> TCallResponse | _ParsedOutputT:
+                cache = claim_response_cache()
                 fn_args = get_fn_args(fn, args, kwargs)
                 dynamic_config = await get_dynamic_configuration(fn, args, kwargs)
                 nonlocal client
@@ -177,6 +183,7 @@ def create_factory(  # noqa: ANN202
                     extract=False,
                     stream=False,
                 )
+                create = cache_create_async(create, model, cache)
                 start_time = datetime.datetime.now().timestamp() * 1000
                 response = await create(stream=False, **call_kwargs)
                 end_time = datetime.datetime.now().timestamp() * 1000
@@ -204,6 +211,7 @@ def create_factory(  # noqa: ANN202
             def inner(
                 *args: _P.args, **kwargs: _P.kwargs
             ) -> TCallResponse | _ParsedOutputT:
+                cache = claim_response_cache()
                 fn_args = get_fn_args(fn, args, kwargs)
                 dynamic_config = get_dynamic_configuration(fn, args, kwargs)
                 nonlocal client
@@ -221,6 +229,7 @@ def create_factory(  # noqa: ANN202
                     extract=False,
                     stream=False,
                 )
+                create = cache_create(create, model, cache)
                 start_time = datetime.datetime.now().timestamp() * 1000
                 response = create(stream=False, **call_kwargs)
                 end_time = datetime.datetime.now().timestamp() * 1000
@@ -9,6 +9,7 @@ serves as an acknowledgment of the original author's contribution to this projec
 """
 
 from copy import deepcopy
+from functools import lru_cache
 from typing import TypeVar, get_args, get_origin
 
 from pydantic import BaseModel, create_model
@@ -62,9 +63,15 @@ def partial(
     user = User()  # All fields optional
     ```
     """
-    if preserve_fields is None:
-        preserve_fields = set()
+    # Partial models are rebuilt for every chunk of a structured stream, so we cache
+    # the generated class per `wrapped_class` rather than recreating it each time.
+    return _partial(wrapped_class, frozenset(preserve_fields or ()))
 
+
+@lru_cache(maxsize=1024)
+def _partial(
+    wrapped_class: type[Model], preserve_fields: frozenset[str]
+) -> type[Model]:
     def _make_field_optional(
         field: FieldInfo,
     ) -> tuple[object, FieldInfo]:
@@ -1,5 +1,6 @@
 """This module contains the function to extract the return value of a tool."""
 
+from functools import lru_cache
 from typing import Any, TypeAlias, TypeVar
 
 import jiter
@@ -15,6 +16,11 @@ _BaseTypeT = TypeVar("_BaseTypeT", bound=BaseType)
 _ResponseModelT: TypeAlias = _BaseModelT | _BaseTypeT
 
 
+@lru_cache(maxsize=1024)
+def _base_type_model(response_model: type[BaseType]) -> type[BaseModel]:
+    return convert_base_type_to_base_tool(response_model, BaseModel)
+
+
 def extract_tool_return(
     response_model: type[_ResponseModelT],
     json_output: str | object,
@@ -30,7 +36,7 @@ def extract_tool_return(
         else json_output
     )
     if is_base_type(response_model):
-        temp_model = convert_base_type_to_base_tool(response_model, BaseModel)
+        temp_model = _base_type_model(response_model)
         if allow_partial:
             return partial(temp_model).model_validate(json_obj).value  # pyright: ignore [reportAttributeAccessIssue]
         return temp_model.model_validate(json_obj).value  # pyright: ignore [reportAttributeAccessIssue]
@@ -1,15 +1,21 @@
 """A function generating content to request JSON mode from models without it."""
 
 import json
+from weakref import WeakKeyDictionary
 
 from ..tool import BaseTool, GenerateJsonSchemaNoTitles
 
+# Keyed weakly so that cached content never keeps (often generated) tool types alive.
+_json_mode_contents: WeakKeyDictionary[type[BaseTool], str] = WeakKeyDictionary()
+
 
 def json_mode_content(tool_type: type[BaseTool] | None) -> str:
     """Returns the content to request JSON mode from models without it."""
     if not tool_type:
         return "\n\nExtract ONLY a valid JSON dict using the schema."
-    return f"""
+    if (content := _json_mode_contents.get(tool_type)) is None:
+        content = _json_mode_contents[tool_type] = f"""
 
 Extract ONLY a valid JSON dict (NOT THE SCHEMA) from the content that adheres to this schema:
 {json.dumps(tool_type.model_json_schema(schema_generator=GenerateJsonSchemaNoTitles), indent=2)}"""
+    return content
@@ -2,6 +2,7 @@
 
 import re
 import urllib.request
+from functools import lru_cache
 from typing import Any, Literal, cast
 
 from typing_extensions import TypedDict
@@ -30,7 +31,8 @@ class _Part(TypedDict):
     options: dict[str, str] | None
 
 
-def _parse_parts(template: str) -> list[_Part]:
+@lru_cache(maxsize=1024)
+def _parse_parts(template: str) -> tuple[_Part, ...]:
     # \{ and \} match the literal curly braces.
     #
     # ([^:{}]*) captures content before the colon that are not { or } or :.
@@ -62,7 +64,7 @@ def _parse_parts(template: str) -> list[_Part]:
                     template=special_content, type=special_type, options=special_options
                 )
             )
-    return parts
+    return tuple(parts)
 
 
 def _load_media(source: str | bytes) -> bytes:
@@ -1,6 +1,8 @@
 """This module provides a function to parse messages from a prompt template."""
 
 import re
+from collections import deque
+from functools import lru_cache
 from typing import Any, TypeVar
 
 from pydantic import BaseModel
@@ -17,6 +19,27 @@ _CallParamsT = TypeVar("_CallParamsT", bound=BaseCallParams)
 _ClientT = TypeVar("_ClientT")
 
 
+@lru_cache(maxsize=1024)
+def _split_template(
+    roles: tuple[str, ...], template: str
+) -> tuple[tuple[str, str], ...]:
+    """Returns the `(role, content_template)` segments of the given `template`.
+
+    Prompt templates are static, so the role keyword scan only needs to happen once
+    per template rather than on every call. For `MESSAGES` segments the content
+    template is replaced with the name of the variable it references.
+    """
+    segments = []
+    re_roles = "|".join([role.upper() for role in roles] + ["MESSAGES"])
+    pattern = rf"({re_roles}):(.+?)(?=(?:{re_roles}):|\Z)"
+    for match in re.finditer(pattern, template, re.DOTALL):
+        role, content_template = match.group(1).lower(), match.group(2).strip()
+        if role == "messages":
+            content_template = get_template_variables(content_template, False)[0]
+        segments.append((role, content_template))
+    return tuple(segments)
+
+
 def parse_prompt_messages(
     roles: list[str],
     template: str,
@@ -26,30 +49,27 @@ def parse_prompt_messages(
     """Returns messages parsed from the provided prompt `template`.
 
     Raises:
-        ValueError: if `MESSAGES` keyword is used with a non-list attribute.
+        ValueError: if `MESSAGES` keyword is used with a non-list/deque attribute.
     """
     if dynamic_config is not None:
         computed_fields = dynamic_config.get("computed_fields", None)
         if computed_fields:
             attrs |= computed_fields
     messages = []
-    re_roles = "|".join([role.upper() for role in roles] + ["MESSAGES"])
-    for match in re.finditer(rf"({re_roles}):((.|\n)+?)(?=({re_roles}):|\Z)", template):
-        role, content_template = match.group(1).lower(), match.group(2).strip()
+    for role, content_template in _split_template(tuple(roles), template):
         if role == "messages":
-            template_variables = get_template_variables(content_template, False)
-            if template_variables[0].startswith("self"):
+            if content_template.startswith("self"):
                 if "self" not in attrs:
                     raise ValueError(
                         "MESSAGES keyword used with `self.` but `self` was not found."
                     )
-                attr = getattr(attrs["self"], template_variables[0][5:])
+                attr = getattr(attrs["self"], content_template[5:])
             else:
-                attr = attrs[template_variables[0]]
-            if attr is None or not isinstance(attr, list):
+                attr = attrs[content_template]
+            if attr is None or not isinstance(attr, list | deque):
                 raise ValueError(
-                    f"MESSAGES keyword used with attribute `{template_variables[0]}`"
-                    ", which is not a `list` of messages."
+                    f"MESSAGES keyword used with attribute `{content_template}`"
+                    ", which is not a `list` or `deque` of messages."
                 )
             messages += attr
         else:
@@ -27,6 +27,48 @@ class ConvertCommonParamsFunc(Protocol[_BaseCallParamsT]):
     def __call__(self, common_params: CommonCallParams) -> _BaseCallParamsT: ...
 
 
+def _convert_tool(
+    tool: type[BaseTool] | Callable, tool_type: type[_BaseToolT]
+) -> type[_BaseToolT]:
+    if inspect.isclass(tool):
+        return convert_base_model_to_base_tool(tool, tool_type)
+    return convert_function_to_base_tool(tool, tool_type)
+
+
+_CONVERTED_TOOLS_ATTR = "__mirascope_converted_tools__"
+
+
+def _convert_tool_with_schema(
+    tool: type[BaseTool] | Callable, tool_type: type[_BaseToolT]
+) -> tuple[type[_BaseToolT], Any]:
+    converted_tool_type = _convert_tool(tool, tool_type)
+    return converted_tool_type, converted_tool_type.tool_schema()
+
+
+def _setup_tool(
+    tool: type[BaseTool] | Callable, tool_type: type[_BaseToolT]
+) -> tuple[type[_BaseToolT], Any]:
+    """Returns the converted tool type and its provider-specific tool schema.
+
+    Classes and functions store their conversion and schema on themselves (per tool
+    type), so passing the same tool again (e.g. a module-level tool or the
+    `response_model` tool built when decorating an extraction) reuses them, and the
+    cached result is freed along with short-lived tools (e.g. toolkit-generated ones).
+    Anything else (e.g. bound methods, which are new objects on every access) is
+    converted every time.
+    """
+    if not (inspect.isclass(tool) or inspect.isfunction(tool)):
+        return _convert_tool_with_schema(tool, tool_type)
+    # `vars` so that subclasses of a cached tool don't see their parent's conversion
+    converted_tools = vars(tool).get(_CONVERTED_TOOLS_ATTR)
+    if converted_tools is None:
+        converted_tools = {}
+        setattr(tool, _CONVERTED_TOOLS_ATTR, converted_tools)
+    if tool_type not in converted_tools:
+        converted_tools[tool_type] = _convert_tool_with_schema(tool, tool_type)
+    return converted_tools[tool_type]
+
+
 def setup_call(
     fn: Callable[..., _BaseDynamicConfigT | Awaitable[_BaseDynamicConfigT]]
     | Callable[..., Sequence[BaseMessageParam]]
@@ -68,12 +110,11 @@ def setup_call(
 
     tool_types = None
     if tools:
-        tool_types = [
-            convert_base_model_to_base_tool(tool, tool_type)
-            if inspect.isclass(tool)
-            else convert_function_to_base_tool(tool, tool_type)
-            for tool in tools
-        ]
-        call_kwargs["tools"] = [tool_type.tool_schema() for tool_type in tool_types]
+        tool_types, tool_schemas = [], []
+        for tool in tools:
+            converted_tool_type, tool_schema = _setup_tool(tool, tool_type)
+            tool_types.append(converted_tool_type)
+            tool_schemas.append(tool_schema)
+        call_kwargs["tools"] = tool_schemas
 
     return prompt_template, messages, tool_types, call_kwargs
@@ -149,6 +149,14 @@ class BaseCallResponse(
         """
         ...
 
+    @property
+    def cached_tokens(self) -> int | float | None:
+        """Returns the number of input tokens read from the provider's prompt cache.
+
+        Providers that report prompt cache hits override this. Otherwise it is None.
+        """
+        return None
+
     @property
     @abstractmethod
     def cost(self) -> float | None:
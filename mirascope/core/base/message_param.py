@@ -21,7 +21,9 @@ class TextPart(BaseModel):
 class CacheControlPart(BaseModel):
     """A part for marking cache control.
 
-    This part is currently only available with Anthropic. For more details, see:
+    This part is currently supported by Anthropic and Bedrock, where it marks a cache
+    breakpoint after the preceding content. OpenAI caches prompt prefixes automatically,
+    so the part is simply dropped. For more details, see:
     https://docs.anthropic.com/en/docs/build-with-claude/prompt-caching
 
     Attributes:
@@ -0,0 +1,99 @@
+"""The `parallel` function for running many calls concurrently."""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import TypeVar, overload
+
+from ._utils import fn_is_async
+
+_InputT = TypeVar("_InputT")
+_OutputT = TypeVar("_OutputT")
+
+
+async def _parallel_async(
+    fn: Callable[[_InputT], Awaitable[_OutputT]],
+    inputs: list[_InputT],
+    max_concurrency: int | None,
+) -> list[_OutputT]:
+    if max_concurrency is None:
+        return list(await asyncio.gather(*(fn(input) for input in inputs)))
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run(input: _InputT) -> _OutputT:
+        async with semaphore:
+            return await fn(input)
+
+    return list(await asyncio.gather(*(run(input) for input in inputs)))
+
+
+@overload
+def parallel(
+    fn: Callable[[_InputT], Awaitable[_OutputT]],
+    inputs: Iterable[_InputT],
+    *,
+    max_concurrency: int | None = None,
+) -> Awaitable[list[_OutputT]]: ...
+
+
+@overload
+def parallel(
+    fn: Callable[[_InputT], _OutputT],
+    inputs: Iterable[_InputT],
+    *,
+    max_concurrency: int | None = None,
+) -> list[_OutputT]: ...
+
+
+def parallel(
+    fn: Callable[[_InputT], Awaitable[_OutputT]] | Callable[[_InputT], _OutputT],
+    inputs: Iterable[_InputT],
+    *,
+    max_concurrency: int | None = None,
+) -> Awaitable[list[_OutputT]] | list[_OutputT]:
+    """Calls `fn` once per input concurrently and returns the outputs in input order.
+
+    Every call is submitted before any result is collected, so the calls always run
+    concurrently. Asynchronous functions are gathered on the running event loop and
+    synchronous functions are run on a thread pool.
+
+    Args:
+        fn: The (typically LLM call decorated) function to call with each input.
+        inputs: The inputs, each of which is passed as the sole argument to `fn`.
+        max_concurrency: The maximum number of calls in flight at once. Useful for
+            staying under provider rate limits. Defaults to running every call at once
+            for asynchronous functions, and to the thread pool's default number of
+            workers (`min(32, os.cpu_count() + 4)`) for synchronous functions.
+
+    Returns:
+        The list of outputs, or an awaitable of the list if `fn` is asynchronous.
+
+    Raises:
+        ValueError: If `max_concurrency` is less than 1.
+
+    Example:
+
+    ```python
+    from mirascope.core import openai, parallel
+
+
+    @openai.call("gpt-4o-mini")
+    async def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+
+    async def main():
+        genres = ["fantasy", "scifi", "mystery"]
+        responses = await parallel(recommend_book, genres, max_concurrency=2)
+    ```
+    """
+    if max_concurrency is not None and max_concurrency < 1:
+        raise ValueError("`max_concurrency` must be at least 1.")
+    inputs = list(inputs)
+    if fn_is_async(fn):
+        return _parallel_async(fn, inputs, max_concurrency)
+
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        futures = [executor.submit(fn, input) for input in inputs]
+        return [future.result() for future in futures]  # pyright: ignore [reportReturnType]
@@ -0,0 +1,231 @@
+"""The `response_cache` decorator for reusing responses to repeated LLM calls."""
+
+import dataclasses
+import hashlib
+import threading
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Mapping
+from contextvars import ContextVar
+from enum import Enum
+from functools import wraps
+from typing import Any, ParamSpec, TypeVar, overload
+
+from pydantic import BaseModel
+
+from ._utils import fn_is_async
+
+_P = ParamSpec("_P")
+_R = TypeVar("_R")
+_ResponseT = TypeVar("_ResponseT")
+
+
+class _UnserializableError(Exception):
+    """Raised when a request contains a value we can't deterministically serialize."""
+
+
+def _serialize(value: Any) -> Any:  # noqa: ANN401
+    """Returns a deterministic, content-based representation of `value`."""
+    if value is None or isinstance(value, str | bytes | int | float | bool):
+        return value
+    if isinstance(value, Enum):
+        return _serialize(value.value)
+    if isinstance(value, Mapping):
+        return sorted((str(key), _serialize(item)) for key, item in value.items())
+    if isinstance(value, list | tuple | set | frozenset):
+        items = [_serialize(item) for item in value]
+        return sorted(items, key=repr) if isinstance(value, set | frozenset) else items
+    if isinstance(value, BaseModel):
+        return _serialize(value.model_dump())
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return _serialize(dataclasses.asdict(value))
+    if callable(to_dict := getattr(value, "to_dict", None)):
+        # e.g. Vertex AI SDK wrappers around proto messages
+        return _serialize(to_dict())
+    if " object at 0x" in (representation := repr(value)):
+        # The default `repr` is identity-based, and addresses get reused once freed.
+        raise _UnserializableError(representation)
+    return representation
+
+
+class _ResponseCache:
+    """A thread-safe, in-memory LRU cache of provider responses."""
+
+    def __init__(self, maxsize: int | None) -> None:
+        self.maxsize = maxsize
+        self._responses: OrderedDict[str, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(model: str, call_kwargs: dict[str, Any]) -> str | None:
+        """Returns the cache key for a request to `model` with the given kwargs.
+
+        Returns `None` if the request can't be keyed by its content, in which case the
+        request should bypass the cache.
+        """
+        try:
+            request = repr((model, _serialize(call_kwargs)))
+        except _UnserializableError:
+            return None
+        return hashlib.blake2b(request.encode(), digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Any:  # noqa: ANN401
+        with self._lock:
+            if key not in self._responses:
+                return None
+            self._responses.move_to_end(key)
+            return self._responses[key]
+
+    def set(self, key: str, response: Any) -> None:  # noqa: ANN401
+        with self._lock:
+            self._responses[key] = response
+            self._responses.move_to_end(key)
+            if self.maxsize is not None and len(self._responses) > self.maxsize:
+                self._responses.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._responses.clear()
+
+
+_active_cache: ContextVar[_ResponseCache | None] = ContextVar(
+    "_active_cache", default=None
+)
+
+
+def claim_response_cache() -> _ResponseCache | None:
+    """Returns the active response cache and deactivates it for any nested calls.
+
+    Each LLM call claims the cache when it starts so that only the call decorated with
+    `response_cache` uses it, not calls made while running it (e.g. in computed fields
+    or output parsers).
+    """
+    cache = _active_cache.get()
+    if cache is not None:
+        _active_cache.set(None)
+    return cache
+
+
+def cache_create(
+    create: Callable[..., _ResponseT], model: str, cache: _ResponseCache | None
+) -> Callable[..., _ResponseT]:
+    """Returns `create` wrapped to use the claimed response `cache`, if any."""
+    if cache is None:
+        return create
+
+    def inner(**kwargs: Any) -> _ResponseT:  # noqa: ANN401
+        if (key := cache.key(model, kwargs)) is None:
+            return create(**kwargs)
+        if (response := cache.get(key)) is None:
+            response = create(**kwargs)
+            cache.set(key, response)
+        return response
+
+    return inner
+
+
+def cache_create_async(
+    create: Callable[..., Awaitable[_ResponseT]],
+    model: str,
+    cache: _ResponseCache | None,
+) -> Callable[..., Awaitable[_ResponseT]]:
+    """Returns the async `create` wrapped to use the claimed response `cache`, if any."""
+    if cache is None:
+        return create
+
+    async def inner(**kwargs: Any) -> _ResponseT:  # noqa: ANN401
+        if (key := cache.key(model, kwargs)) is None:
+            return await create(**kwargs)
+        if (response := cache.get(key)) is None:
+            response = await create(**kwargs)
+            cache.set(key, response)
+        return response
+
+    return inner
+
+
+@overload
+def response_cache(
+    fn: Callable[_P, _R], *, maxsize: int | None = 128
+) -> Callable[_P, _R]: ...
+
+
+@overload
+def response_cache(
+    fn: None = None, *, maxsize: int | None = 128
+) -> Callable[[Callable[_P, _R]], Callable[_P, _R]]: ...
+
+
+def response_cache(
+    fn: Callable[_P, _R] | None = None, *, maxsize: int | None = 128
+) -> Callable[_P, _R] | Callable[[Callable[_P, _R]], Callable[_P, _R]]:
+    """Caches the provider responses of the decorated LLM call in memory.
+
+    Repeated calls that render to the exact same request (model, messages, tools, and
+    call params) reuse the original provider response instead of calling the API
+    again. Each hit still constructs a fresh call response (or response model), so
+    output parsers and extraction run as usual. Streaming calls are not cached, nor are
+    requests containing values that can't be serialized by content.
+
+    Note that a hit reports the original response's usage and cost, so anything that
+    tracks spend from call responses will count a cached call as if it were made again.
+
+    The cache is keyed on the rendered request rather than the function's arguments,
+    so calls whose dynamic configuration changes the prompt are never conflated. Only
+    the decorated call itself is cached; any other calls made while running it (e.g. in
+    computed fields) always go to the provider.
+
+    Args:
+        fn: The LLM call decorated function to cache.
+        maxsize: The maximum number of responses to keep, evicting the least recently
+            used first. `None` means the cache is unbounded.
+
+    Returns:
+        The decorated function. Its cache can be emptied with `fn.cache_clear()`.
+
+    Example:
+
+    ```python
+    from mirascope.core import openai, response_cache
+
+
+    @response_cache
+    @openai.call("gpt-4o-mini")
+    def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+
+    response = recommend_book("fantasy")
+    response = recommend_book("fantasy")  # reuses the first response
+    ```
+    """
+
+    def decorator(fn: Callable[_P, _R]) -> Callable[_P, _R]:
+        cache = _ResponseCache(maxsize)
+
+        if fn_is_async(fn):
+
+            @wraps(fn)
+            async def inner_async(*args: _P.args, **kwargs: _P.kwargs) -> Any:  # noqa: ANN401
+                token = _active_cache.set(cache)
+                try:
+                    return await fn(*args, **kwargs)  # pyright: ignore [reportGeneralTypeIssues]
+                finally:
+                    _active_cache.reset(token)
+
+            inner_async.cache_clear = cache.clear  # pyright: ignore [reportFunctionMemberAccess]
+            return inner_async  # pyright: ignore [reportReturnType]
+
+        @wraps(fn)
+        def inner(*args: _P.args, **kwargs: _P.kwargs) -> _R:
+            token = _active_cache.set(cache)
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                _active_cache.reset(token)
+
+        inner.cache_clear = cache.clear  # pyright: ignore [reportFunctionMemberAccess]
+        return inner
+
+    if fn is not None:
+        return decorator(fn)
+    return decorator
@@ -34,6 +34,7 @@ from .dynamic_config import BaseDynamicConfig
 from .messages import Messages
 from .metadata import Metadata
 from .prompt import prompt_template
+from .response_cache import claim_response_cache
 from .tool import BaseTool
 
 _BaseCallResponseT = TypeVar("_BaseCallResponseT", bound=BaseCallResponse)
@@ -138,9 +139,9 @@ class BaseStream(
         self,
     ) -> Generator[tuple[_BaseCallResponseChunkT, _BaseToolT | None], None, None]:
         """Iterator over the stream and stores useful information."""
-        assert isinstance(
-            self.stream, Generator
-        ), "Stream must be a generator for __iter__"
+        assert isinstance(self.stream, Generator), (
+            "Stream must be a generator for __iter__"
+        )
         self.content, tool_calls = "", []
         self.start_time = datetime.datetime.now().timestamp() * 1000
         for chunk, tool in self.stream:
@@ -161,12 +162,12 @@ class BaseStream(
         """Iterates over the stream and stores useful information."""
         self.content = ""
 
-        async def generator() -> (
-            AsyncGenerator[tuple[_BaseCallResponseChunkT, _BaseToolT | None], None]
-        ):
-            assert isinstance(
-                self.stream, AsyncGenerator
-            ), "Stream must be an async generator for __aiter__"
+        async def generator() -> AsyncGenerator[
+            tuple[_BaseCallResponseChunkT, _BaseToolT | None], None
+        ]:
+            assert isinstance(self.stream, AsyncGenerator), (
+                "Stream must be an async generator for __aiter__"
+            )
             tool_calls = []
             async for chunk, tool in self.stream:
                 self._update_properties(chunk)
@@ -183,25 +184,26 @@ class BaseStream(
 
     def _update_properties(self, chunk: _BaseCallResponseChunkT) -> None:
         """Updates the properties of the stream."""
+        # Chunk properties are computed on access, so we read each one exactly once.
         self.content += chunk.content
-        if chunk.input_tokens is not None:
+        if (input_tokens := chunk.input_tokens) is not None:
             self.input_tokens = (
-                chunk.input_tokens
+                input_tokens
                 if not self.input_tokens
-                else self.input_tokens + chunk.input_tokens
+                else self.input_tokens + input_tokens
             )
-        if chunk.output_tokens is not None:
+        if (output_tokens := chunk.output_tokens) is not None:
             self.output_tokens = (
-                chunk.output_tokens
+                output_tokens
                 if not self.output_tokens
-                else self.output_tokens + chunk.output_tokens
+                else self.output_tokens + output_tokens
             )
-        if chunk.model is not None:
-            self.model = chunk.model
-        if chunk.id is not None:
-            self.id = chunk.id
-        if chunk.finish_reasons is not None:
-            self.finish_reasons = chunk.finish_reasons
+        if (model := chunk.model) is not None:
+            self.model = model
+        if (chunk_id := chunk.id) is not None:
+            self.id = chunk_id
+        if (finish_reasons := chunk.finish_reasons) is not None:
+            self.finish_reasons = finish_reasons
 
     @property
     @abstractmethod
@@ -355,6 +357,8 @@ def stream_factory(  # noqa: ANN201
 
             @wraps(fn)
             async def inner_async(*args: _P.args, **kwargs: _P.kwargs) -> BaseStream:
+                # Streams aren't cached, but nested calls mustn't use the cache either.
+                claim_response_cache()
                 fn_args = get_fn_args(fn, args, kwargs)
                 dynamic_config = await get_dynamic_configuration(fn, args, kwargs)
                 nonlocal client
@@ -373,11 +377,9 @@ def stream_factory(  # noqa: ANN201
                     stream=True,
                 )
 
-                async def generator() -> (
-                    AsyncGenerator[
-                        tuple[_BaseCallResponseChunkT, _BaseToolT | None], None
-                    ]
-                ):
+                async def generator() -> AsyncGenerator[
+                    tuple[_BaseCallResponseChunkT, _BaseToolT | None], None
+                ]:
                     async for chunk, tool in handle_stream_async(
                         await create(stream=True, **call_kwargs),
                         tool_types,
@@ -404,6 +406,8 @@ def stream_factory(  # noqa: ANN201
 
             @wraps(fn)
             def inner(*args: _P.args, **kwargs: _P.kwargs) -> BaseStream:
+                # Streams aren't cached, but nested calls mustn't use the cache either.
+                claim_response_cache()
                 fn_args = get_fn_args(fn, args, kwargs)
                 dynamic_config = get_dynamic_configuration(fn, args, kwargs)
                 nonlocal client
@@ -422,13 +426,11 @@ def stream_factory(  # noqa: ANN201
                     stream=True,
                 )
 
-                def generator() -> (
-                    Generator[
-                        tuple[_BaseCallResponseChunkT, _BaseToolT | None],
-                        None,
-                        None,
-                    ]
-                ):
+                def generator() -> Generator[
+                    tuple[_BaseCallResponseChunkT, _BaseToolT | None],
+                    None,
+                    None,
+                ]:
                     yield from handle_stream(
                         create(stream=True, **call_kwargs),
                         tool_types,
@@ -25,6 +25,8 @@ def convert_message_params(
             for part in content:
                 if part.type == "text":
                     converted_content.append({"text": part.text})
+                elif part.type == "cache_control":
+                    converted_content.append({"cachePoint": {"type": "default"}})
                 elif part.type == "image":
                     if part.media_type not in [
                         "image/jpeg",
@@ -41,7 +43,8 @@ def convert_message_params(
                     )
                 else:
                     raise ValueError(
-                        "Bedrock currently only supports text and image parts. "
+                        "Bedrock currently only supports text, image, and cache "
+                        "control parts. "
                         f"Part provided: {part.type}"
                     )
             converted_message_params.append(
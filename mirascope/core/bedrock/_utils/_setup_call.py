@@ -168,10 +168,10 @@ def setup_call(
     messages = cast(list[InternalBedrockMessageParam | BaseMessageParam], messages)
     messages = convert_message_params(messages)
     if messages[0]["role"] == "system":
-        call_kwargs["system"] = [
-            {"text": text}
+        call_kwargs["system"] = [  # pyright: ignore [reportGeneralTypeIssues]
+            {"text": text} if (text := c.get("text")) else c
             for c in messages.pop(0)["content"]
-            if (text := c.get("text"))
+            if c.get("text") or "cachePoint" in c
         ]
 
     call_kwargs_tools = call_kwargs.pop("tools", None)
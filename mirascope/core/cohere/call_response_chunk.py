@@ -3,6 +3,9 @@
 usage docs: learn/streams.md#handling-streamed-responses
 """
 
+from collections.abc import Callable
+from typing import Any
+
 from cohere.types import (
     ApiMetaBilledUnits,
     ChatStreamEndEventFinishReason,
@@ -18,6 +21,52 @@ from ._types import (
 )
 
 
+def _text_generation_content(chunk: TextGenerationStreamedChatResponse) -> str:
+    return chunk.text
+
+
+def _stream_end_finish_reasons(
+    chunk: StreamEndStreamedChatResponse,
+) -> list[ChatStreamEndEventFinishReason]:
+    return [chunk.finish_reason]
+
+
+def _stream_start_id(chunk: StreamStartStreamedChatResponse) -> str | None:
+    return chunk.generation_id
+
+
+def _stream_end_id(chunk: StreamEndStreamedChatResponse) -> str | None:
+    return chunk.response.generation_id
+
+
+def _stream_end_usage(
+    chunk: StreamEndStreamedChatResponse,
+) -> ApiMetaBilledUnits | None:
+    if chunk.response.meta:
+        return chunk.response.meta.billed_units
+    return None
+
+
+# Streamed chunks are a tagged union of concrete classes, so we dispatch on the exact
+# chunk type with a single dict lookup rather than walking an `isinstance` chain on
+# every chunk of the stream.
+_CONTENT_GETTERS: dict[type, Callable[[Any], str]] = {
+    TextGenerationStreamedChatResponse: _text_generation_content,
+}
+_FINISH_REASONS_GETTERS: dict[
+    type, Callable[[Any], list[ChatStreamEndEventFinishReason]]
+] = {
+    StreamEndStreamedChatResponse: _stream_end_finish_reasons,
+}
+_ID_GETTERS: dict[type, Callable[[Any], str | None]] = {
+    StreamStartStreamedChatResponse: _stream_start_id,
+    StreamEndStreamedChatResponse: _stream_end_id,
+}
+_USAGE_GETTERS: dict[type, Callable[[Any], ApiMetaBilledUnits | None]] = {
+    StreamEndStreamedChatResponse: _stream_end_usage,
+}
+
+
 class CohereCallResponseChunk(
     BaseCallResponseChunk[
         SkipValidation[StreamedChatResponse], ChatStreamEndEventFinishReason
@@ -50,15 +99,15 @@ class CohereCallResponseChunk(
     @property
     def content(self) -> str:
         """Returns the content for the 0th choice delta."""
-        if isinstance(self.chunk, TextGenerationStreamedChatResponse):
-            return self.chunk.text
+        if getter := _CONTENT_GETTERS.get(type(self.chunk)):
+            return getter(self.chunk)
         return ""
 
     @property
     def finish_reasons(self) -> list[ChatStreamEndEventFinishReason] | None:
         """Returns the finish reasons of the response."""
-        if isinstance(self.chunk, StreamEndStreamedChatResponse):
-            return [self.chunk.finish_reason]
+        if getter := _FINISH_REASONS_GETTERS.get(type(self.chunk)):
+            return getter(self.chunk)
         return None
 
     @property
@@ -72,20 +121,15 @@ class CohereCallResponseChunk(
     @property
     def id(self) -> str | None:
         """Returns the id of the response."""
-        if isinstance(self.chunk, StreamStartStreamedChatResponse):
-            return self.chunk.generation_id
-        elif isinstance(self.chunk, StreamEndStreamedChatResponse):
-            return self.chunk.response.generation_id
+        if getter := _ID_GETTERS.get(type(self.chunk)):
+            return getter(self.chunk)
         return None
 
     @property
     def usage(self) -> ApiMetaBilledUnits | None:
         """Returns the usage of the response."""
-        if (
-            isinstance(self.chunk, StreamEndStreamedChatResponse)
-            and self.chunk.response.meta
-        ):
-            return self.chunk.response.meta.billed_units
+        if getter := _USAGE_GETTERS.get(type(self.chunk)):
+            return getter(self.chunk)
         return None
 
     @property
@@ -1,7 +1,7 @@
 """This module contains the setup_call function, which is used to set up the"""
 
 from collections.abc import Awaitable, Callable
-from dataclasses import asdict, is_dataclass
+from dataclasses import asdict
 from typing import Any, cast, overload
 
 from google.generativeai import GenerativeModel
@@ -109,8 +109,12 @@ def setup_call(
     messages = convert_message_params(messages)
     if json_mode:
         generation_config = call_kwargs.get("generation_config", {})
-        if is_dataclass(generation_config):
-            generation_config = asdict(generation_config)
+        # Copy so the user's call params aren't mutated by (and reused across) calls.
+        generation_config = (
+            dict(generation_config)
+            if isinstance(generation_config, dict)
+            else asdict(generation_config)  # pyright: ignore [reportArgumentType]
+        )
         generation_config["response_mime_type"] = "application/json"
         call_kwargs["generation_config"] = cast(GenerationConfigDict, generation_config)
         messages[-1]["parts"].append(
@@ -119,7 +123,6 @@ def setup_call(
         call_kwargs.pop("tools", None)
     elif extract:
         assert tool_types, "At least one tool must be provided for extraction."
-        call_kwargs.pop("tool_config", None)
         tool_config = ToolConfigDict()
         tool_config.function_calling_config = {
             "mode": "any",
@@ -14,20 +14,23 @@ from mistralai.models import (
 
 from ...base import BaseMessageParam
 
+_MESSAGE_TYPES: dict[
+    str, type[AssistantMessage | SystemMessage | ToolMessage | UserMessage]
+] = {
+    "assistant": AssistantMessage,
+    "system": SystemMessage,
+    "tool": ToolMessage,
+    "user": UserMessage,
+}
+
 
 def _make_message(
     role: str,
     **kwargs,  # noqa: ANN003
 ) -> AssistantMessage | SystemMessage | ToolMessage | UserMessage:
-    if role == "assistant":
-        return AssistantMessage(**kwargs)
-    elif role == "system":
-        return SystemMessage(**kwargs)
-    elif role == "tool":
-        return ToolMessage(**kwargs)
-    elif role == "user":
-        return UserMessage(**kwargs)
-    raise ValueError(f"Invalid role: {role}")
+    if (message_type := _MESSAGE_TYPES.get(role)) is None:
+        raise ValueError(f"Invalid role: {role}")
+    return message_type(**kwargs)
 
 
 def convert_message_params(
@@ -40,7 +43,9 @@ def convert_message_params(
         if not isinstance(message_param, BaseMessageParam):
             converted_message_params.append(message_param)
         elif isinstance(content := message_param.content, str):
-            converted_message_params.append(_make_message(**message_param.model_dump()))
+            converted_message_params.append(
+                _make_message(role=message_param.role, content=content)
+            )
         else:
             converted_content = []
             for part in content:
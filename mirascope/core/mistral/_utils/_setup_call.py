@@ -1,12 +1,15 @@
 """This module contains the setup_call function for Mistral tools."""
 
+import atexit
 import os
 from collections.abc import (
     Awaitable,
     Callable,
 )
+from functools import lru_cache
 from typing import Any, cast, overload
 
+import httpx
 from mistralai import Mistral
 from mistralai.models import (
     AssistantMessage,
@@ -38,6 +41,24 @@ from ..tool import MistralTool
 from ._convert_common_call_params import convert_common_call_params
 from ._convert_message_params import convert_message_params
 
+_JSON_RESPONSE_FORMAT = ResponseFormat(type="json_object")
+
+
+@lru_cache(maxsize=8)
+def _get_default_client(api_key: str) -> Mistral:
+    """Returns a shared `Mistral` client so connections are reused across calls.
+
+    Only the sync transport is pooled: an `httpx.AsyncClient` is bound to the event loop
+    it first ran on, so async calls keep constructing their own client.
+    """
+    http_client = httpx.Client(
+        limits=httpx.Limits(
+            max_connections=100, max_keepalive_connections=50, keepalive_expiry=30
+        )
+    )
+    atexit.register(http_client.close)
+    return Mistral(api_key=api_key, client=http_client)
+
 
 @overload
 def setup_call(
@@ -125,7 +146,7 @@ def setup_call(
     )
     messages = convert_message_params(messages)
     if json_mode:
-        call_kwargs["response_format"] = ResponseFormat(type="json_object")
+        call_kwargs["response_format"] = _JSON_RESPONSE_FORMAT
         json_mode_content = _utils.json_mode_content(
             tool_types[0] if tool_types else None
         )
@@ -142,12 +163,14 @@ def setup_call(
         call_kwargs["tool_choice"] = cast(ToolChoiceEnum, "any")
     call_kwargs |= {"model": model, "messages": messages}
 
-    if client is None:
-        client = Mistral(api_key=os.environ["MISTRAL_API_KEY"])
     if fn_is_async(fn):
+        if client is None:
+            client = Mistral(api_key=os.environ["MISTRAL_API_KEY"])
         create_or_stream = get_async_create_fn(
             client.chat.complete_async, client.chat.stream_async
         )
     else:
+        if client is None:
+            client = _get_default_client(os.environ["MISTRAL_API_KEY"])
         create_or_stream = get_create_fn(client.chat.complete, client.chat.stream)
     return create_or_stream, prompt_template, messages, tool_types, call_kwargs
@@ -5,6 +5,7 @@ def calculate_cost(
     input_tokens: int | float | None,
     output_tokens: int | float | None,
     model: str = "gpt-3.5-turbo-16k",
+    cached_tokens: int | float | None = None,
 ) -> float | None:
     """Calculate the cost of a completion using the OpenAI API.
 
@@ -25,22 +26,35 @@ def calculate_cost(
     text-embedding-3-small	$0.02 / 1M tokens
     text-embedding-3-large	$0.13 / 1M tokens
     text-embedding-ada-0002	$0.10 / 1M tokens
+
+    Cached input tokens are included in `input_tokens` and billed at the discounted
+    cached rate where the model supports prompt caching:
+
+    Model                   Cached Input
+    gpt-4o-mini             $0.075 / 1M tokens
+    gpt-4o-mini-2024-07-18  $0.075 / 1M tokens
+    gpt-4o                  $1.25 / 1M tokens
+    gpt-4o-2024-08-06       $1.25 / 1M tokens
     """
     pricing = {
         "gpt-4o-mini": {
             "prompt": 0.000_000_15,
+            "cached": 0.000_000_075,
             "completion": 0.000_000_6,
         },
         "gpt-4o-mini-2024-07-18": {
             "prompt": 0.000_000_15,
+            "cached": 0.000_000_075,
             "completion": 0.000_000_6,
         },
         "gpt-4o": {
             "prompt": 0.000_002_5,
+            "cached": 0.000_001_25,
             "completion": 0.000_01,
         },
         "gpt-4o-2024-08-06": {
             "prompt": 0.000_002_5,
+            "cached": 0.000_001_25,
             "completion": 0.000_01,
         },
         "gpt-4o-2024-05-13": {
@@ -108,8 +122,11 @@ def calculate_cost(
     except KeyError:
         return None
 
-    prompt_cost = input_tokens * model_pricing["prompt"]
+    if cached_tokens is None:
+        cached_tokens = 0
+    prompt_cost = (input_tokens - cached_tokens) * model_pricing["prompt"]
+    cached_cost = cached_tokens * model_pricing.get("cached", model_pricing["prompt"])
     completion_cost = output_tokens * model_pricing["completion"]
-    total_cost = prompt_cost + completion_cost
+    total_cost = prompt_cost + cached_cost + completion_cost
 
     return total_cost
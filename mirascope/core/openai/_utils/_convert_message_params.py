@@ -21,6 +21,10 @@ def convert_message_params(
             for part in content:
                 if part.type == "text":
                     converted_content.append(part.model_dump())
+                elif part.type == "cache_control":
+                    # OpenAI caches prompt prefixes automatically, so breakpoints are
+                    # accepted for portability but require no explicit marker.
+                    continue
                 elif part.type == "image":
                     if part.media_type not in [
                         "image/jpeg",
@@ -4,6 +4,7 @@ usage docs: learn/calls.md#handling-responses
 """
 
 import base64
+from functools import cached_property
 
 from openai.types.chat import (
     ChatCompletion,
@@ -110,10 +111,24 @@ class OpenAICallResponse(
         """Returns the number of output tokens."""
         return self.usage.completion_tokens if self.usage else None
 
+    @property
+    def cached_tokens(self) -> int | None:
+        """Returns the number of cached input tokens."""
+        if self.usage and (
+            details := getattr(self.usage, "prompt_tokens_details", None)
+        ):
+            return details.cached_tokens
+        return None
+
     @property
     def cost(self) -> float | None:
         """Returns the cost of the call."""
-        return calculate_cost(self.input_tokens, self.output_tokens, self.model)
+        return calculate_cost(
+            self.input_tokens,
+            self.output_tokens,
+            self.model,
+            cached_tokens=self.cached_tokens,
+        )
 
     @computed_field
     @property
@@ -126,6 +141,14 @@ class OpenAICallResponse(
             message_param["audio"] = {"id": audio.id}
         return ChatCompletionAssistantMessageParam(**message_param)
 
+    @cached_property
+    def _tool_types_by_name(self) -> dict[str, type[OpenAITool]]:
+        # Iterate in reverse so the first tool type with a given name wins on conflict.
+        return {
+            tool_type._name(): tool_type
+            for tool_type in reversed(self.tool_types or [])
+        }
+
     @computed_field
     @property
     def tools(self) -> list[OpenAITool] | None:
@@ -145,14 +168,11 @@ class OpenAICallResponse(
         if not self.tool_types or not tool_calls:
             return None
 
-        extracted_tools = []
-        for tool_call in tool_calls:
-            for tool_type in self.tool_types:
-                if tool_call.function.name == tool_type._name():
-                    extracted_tools.append(tool_type.from_tool_call(tool_call))
-                    break
-
-        return extracted_tools
+        return [
+            tool_type.from_tool_call(tool_call)
+            for tool_call in tool_calls
+            if (tool_type := self._tool_types_by_name.get(tool_call.function.name))
+        ]
 
     @computed_field
     @property
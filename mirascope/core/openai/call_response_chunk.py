@@ -6,6 +6,7 @@ usage docs: learn/streams.md#handling-streamed-responses
 from __future__ import annotations
 
 import base64
+from functools import cached_property
 
 from openai.types.chat import ChatCompletionChunk
 from openai.types.chat.chat_completion_chunk import Choice
@@ -44,16 +45,16 @@ class OpenAICallResponseChunk(BaseCallResponseChunk[ChatCompletionChunk, FinishR
 
     chunk: SkipValidation[ChatCompletionChunk]
 
-    @property
-    def content(self) -> str:
+    @cached_property
+    def content(self) -> str:  # pyright: ignore [reportIncompatibleMethodOverride]
         """Returns the content for the 0th choice delta."""
         delta = None
         if self.chunk.choices:
             delta = self.chunk.choices[0].delta
         return delta.content if delta is not None and delta.content else ""
 
-    @property
-    def finish_reasons(self) -> list[FinishReason]:
+    @cached_property
+    def finish_reasons(self) -> list[FinishReason]:  # pyright: ignore [reportIncompatibleMethodOverride]
         """Returns the finish reasons of the response."""
         return [
             choice.finish_reason
@@ -71,25 +72,23 @@ class OpenAICallResponseChunk(BaseCallResponseChunk[ChatCompletionChunk, FinishR
         """Returns the id of the response."""
         return self.chunk.id
 
-    @property
-    def usage(self) -> CompletionUsage | None:
+    @cached_property
+    def usage(self) -> CompletionUsage | None:  # pyright: ignore [reportIncompatibleMethodOverride]
         """Returns the usage of the chat completion."""
-        if hasattr(self.chunk, "usage") and self.chunk.usage:
-            return self.chunk.usage
-        return None
+        return getattr(self.chunk, "usage", None) or None
 
     @property
     def input_tokens(self) -> int | None:
         """Returns the number of input tokens."""
-        if self.usage:
-            return self.usage.prompt_tokens
+        if usage := self.usage:
+            return usage.prompt_tokens
         return None
 
     @property
     def output_tokens(self) -> int | None:
         """Returns the number of output tokens."""
-        if self.usage:
-            return self.usage.completion_tokens
+        if usage := self.usage:
+            return usage.completion_tokens
         return None
 
     @computed_field
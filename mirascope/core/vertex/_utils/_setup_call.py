@@ -1,8 +1,10 @@
 """This module contains the setup_call function, which is used to set up the"""
 
 from collections.abc import AsyncIterable, Awaitable, Callable, Iterable
+from functools import lru_cache
 from typing import Any, cast, overload
 
+from google.cloud.aiplatform import initializer as aiplatform_initializer
 from google.cloud.aiplatform_v1beta1.types import FunctionCallingConfig
 from vertexai.generative_models import (
     Content,
@@ -31,6 +33,33 @@ from ._convert_common_call_params import convert_common_call_params
 from ._convert_message_params import convert_message_params
 
 
+@lru_cache(maxsize=32)
+def _get_cached_client(model: str, project: str, location: str) -> GenerativeModel:
+    return GenerativeModel(model_name=model)
+
+
+def _get_default_client(model: str) -> GenerativeModel:
+    """Returns a shared `GenerativeModel` for `model` so it's reused across calls.
+
+    `GenerativeModel` resolves the project and location when constructed, so they are
+    part of the cache key to pick up later `vertexai.init` calls. Only sync calls share
+    a model: its async gRPC client is bound to the event loop it first ran on.
+    """
+    config = aiplatform_initializer.global_config
+    return _get_cached_client(model, config.project, config.location)
+
+
+@lru_cache(maxsize=64)
+def _get_extract_tool_config(tool_name: str) -> ToolConfig:
+    """Returns the `ToolConfig` that forces a call to the `tool_name` tool."""
+    return ToolConfig(
+        function_calling_config=ToolConfig.FunctionCallingConfig(
+            mode=FunctionCallingConfig.Mode.ANY,
+            allowed_function_names=[tool_name],
+        )
+    )
+
+
 @overload
 def setup_call(
     *,
@@ -124,29 +153,22 @@ def setup_call(
         call_kwargs.pop("tools", None)
     elif extract:
         assert tool_types, "At least one tool must be provided for extraction."
-        call_kwargs.pop("tool_config", None)
-        tool_config = ToolConfig(
-            function_calling_config=ToolConfig.FunctionCallingConfig(
-                mode=FunctionCallingConfig.Mode.ANY,
-                allowed_function_names=[tool_types[0]._name()],
-            )
-        )
-        call_kwargs["tool_config"] = tool_config
+        call_kwargs["tool_config"] = _get_extract_tool_config(tool_types[0]._name())
     call_kwargs |= {"contents": messages}
 
-    if client is None:
-        client = GenerativeModel(model_name=model)
-
-    create = (
-        cast(
+    if fn_is_async(fn):
+        if client is None:
+            client = GenerativeModel(model_name=model)
+        create = cast(
             AsyncCreateFn[GenerationResponse, AsyncIterable[GenerationResponse]],
             get_async_create_fn(client.generate_content_async),
         )
-        if fn_is_async(fn)
-        else cast(
+    else:
+        if client is None:
+            client = _get_default_client(model)
+        create = cast(
             CreateFn[GenerationResponse, Iterable[GenerationResponse]],
             get_create_fn(client.generate_content),
         )
-    )
 
     return create, prompt_template, messages, tool_types, call_kwargs
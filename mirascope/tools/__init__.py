@@ -1,25 +1,50 @@
-from contextlib import suppress
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
 from .system._file_system import FileSystemToolKit, FileSystemToolKitConfig
 
-with suppress(ImportError):
+if TYPE_CHECKING:
     from .system._docker_operation import (
         DockerOperationToolKit,
         DockerOperationToolKitConfig,
     )
-
-with suppress(ImportError):
     from .web._duckduckgo import DuckDuckGoSearch, DuckDuckGoSearchConfig
-
-with suppress(ImportError):
     from .web._httpx import HTTPX, AsyncHTTPX, HTTPXConfig
-
-with suppress(ImportError):
     from .web._parse_url_content import ParseURLConfig, ParseURLContent
-
-with suppress(ImportError):
     from .web._requests import Requests, RequestsConfig
 
+# These tools depend on optional (and often heavy) packages, so we only import a tool's
+# module the first time it's accessed rather than importing all of them up front.
+_LAZY_TOOLS = {
+    "DockerOperationToolKit": ".system._docker_operation",
+    "DockerOperationToolKitConfig": ".system._docker_operation",
+    "DuckDuckGoSearch": ".web._duckduckgo",
+    "DuckDuckGoSearchConfig": ".web._duckduckgo",
+    "HTTPX": ".web._httpx",
+    "AsyncHTTPX": ".web._httpx",
+    "HTTPXConfig": ".web._httpx",
+    "ParseURLContent": ".web._parse_url_content",
+    "ParseURLConfig": ".web._parse_url_content",
+    "Requests": ".web._requests",
+    "RequestsConfig": ".web._requests",
+}
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    if name in _LAZY_TOOLS:
+        try:
+            return getattr(import_module(_LAZY_TOOLS[name], __name__), name)
+        except ImportError as e:
+            raise AttributeError(
+                f"module {__name__!r} has no attribute {name!r}"
+            ) from e
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
 __all__ = [
     "AsyncHTTPX",
     "DockerOperationToolKit",
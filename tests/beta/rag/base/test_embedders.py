@@ -0,0 +1,115 @@
+"""Tests for the `BaseEmbedder` class."""
+
+import asyncio
+
+import numpy as np
+import pytest
+
+try:
+    from mirascope.beta.rag.base.embedders import BaseEmbedder
+    from mirascope.beta.rag.base.embedding_response import BaseEmbeddingResponse
+except (ImportError, OSError) as e:  # e.g. `sounddevice` without PortAudio installed
+    pytest.skip(f"`mirascope.beta` can't be imported: {e}", allow_module_level=True)
+
+
+class _EmbeddingResponse(BaseEmbeddingResponse[list[list[float]] | None]):
+    @property
+    def embeddings(self) -> list[list[float]] | None:
+        return self.response
+
+
+class _Embedder(BaseEmbedder[_EmbeddingResponse]):
+    """Embeds each input as `[len(input), 0.0]`, tracking concurrent requests."""
+
+    def model_post_init(self, __context: object) -> None:
+        self._batches: list[list[str]] = []
+        self._in_flight = 0
+        self._max_in_flight = 0
+
+    def embed(self, input: list[str]) -> _EmbeddingResponse:
+        return _EmbeddingResponse(
+            response=[[float(len(text)), 0.0] for text in input],
+            start_time=0,
+            end_time=0,
+        )
+
+    async def embed_async(self, input: list[str]) -> _EmbeddingResponse:
+        self._batches.append(input)
+        self._in_flight += 1
+        self._max_in_flight = max(self._max_in_flight, self._in_flight)
+        await asyncio.sleep(0)
+        self._in_flight -= 1
+        return self.embed(input)
+
+
+def test_embed_batch() -> None:
+    """Tests that `embed_batch` embeds every input in order across batches."""
+    embedder = _Embedder()
+    inputs = ["a" * (i + 1) for i in range(10)]
+    embeddings = embedder.embed_batch(inputs, batch_size=3, max_concurrency=2)
+    assert embeddings == [[float(i + 1), 0.0] for i in range(10)]
+    assert [len(batch) for batch in embedder._batches] == [3, 3, 3, 1]
+    assert embedder._max_in_flight == 2
+
+
+@pytest.mark.parametrize(
+    "kwargs,match",
+    [
+        ({"batch_size": 0}, "`batch_size` must be at least 1"),
+        ({"max_concurrency": 0}, "`max_concurrency` must be at least 1"),
+    ],
+)
+def test_embed_batch_invalid_args(kwargs: dict, match: str) -> None:
+    """Tests that `embed_batch` rejects batch sizes and concurrencies below 1."""
+    embedder = _Embedder()
+    with pytest.raises(ValueError, match=match):
+        embedder.embed_batch(["a"], **kwargs)
+    assert embedder._batches == []
+
+
+def test_embed_batch_missing_embeddings() -> None:
+    """Tests that `embed_batch` raises rather than misaligning embeddings."""
+
+    class _MissingEmbeddingsEmbedder(_Embedder):
+        async def embed_async(self, input: list[str]) -> _EmbeddingResponse:
+            if input[0] == "b":
+                return _EmbeddingResponse(response=None, start_time=0, end_time=0)
+            return await super().embed_async(input)
+
+    with pytest.raises(ValueError, match="batch starting at input 1"):
+        _MissingEmbeddingsEmbedder().embed_batch(["a", "b", "c"], batch_size=1)
+
+
+@pytest.mark.asyncio
+async def test_embed_batch_async_empty() -> None:
+    """Tests that `embed_batch_async` makes no requests for empty inputs."""
+    embedder = _Embedder()
+    assert await embedder.embed_batch_async([]) == []
+    assert embedder._batches == []
+
+
+def test_embed_numpy() -> None:
+    """Tests that `embed_numpy` returns normalized rows, leaving zero vectors as is."""
+    embedder = _Embedder()
+    embeddings = embedder.embed_numpy(["abc", "", "abcd"])
+    assert embeddings.shape == (3, 2)
+    assert embeddings.dtype == np.float16
+    assert embeddings.flags.c_contiguous
+    assert embeddings.tolist() == [[1.0, 0.0], [0.0, 0.0], [1.0, 0.0]]
+
+    embeddings = embedder.embed_numpy(["abc"], normalize=False, dtype="float32")
+    assert embeddings.dtype == np.float32
+    assert embeddings.tolist() == [[3.0, 0.0]]
+
+
+def test_embed_numpy_empty() -> None:
+    """Tests that `embed_numpy` returns an empty array for empty inputs."""
+    embeddings = _Embedder(dimensions=2).embed_numpy([])
+    assert embeddings.shape == (0, 2)
+    assert embeddings.dtype == np.float16
+
+
+def test_embed_numpy_invalid_dtype() -> None:
+    """Tests that `embed_numpy` rejects non-floating point dtypes."""
+    with pytest.raises(ValueError, match="floating point dtype"):
+        _Embedder().embed_numpy(["abc"], dtype="int8")
@@ -1,5 +1,6 @@
 """Tests the `anthropic.call_response` module."""
 
+import pytest
 from anthropic.types import (
     Message,
     MessageParam,
@@ -49,7 +50,13 @@ def test_anthropic_call_response() -> None:
     assert call_response.usage == usage
     assert call_response.input_tokens == 1
     assert call_response.output_tokens == 1
+    assert call_response.cached_tokens is None
     assert call_response.cost == 1.8e-5
+    usage_with_cache = Usage(input_tokens=1, output_tokens=1)
+    usage_with_cache.cache_read_input_tokens = 10  # pyright: ignore [reportAttributeAccessIssue]
+    call_response.response.usage = usage_with_cache
+    assert call_response.cached_tokens == 10
+    assert call_response.cost == pytest.approx(2.1e-5)
     assert call_response.message_param == {
         "content": [{"text": "content", "type": "text"}],
         "role": "assistant",
@@ -2,7 +2,10 @@
 
 from unittest.mock import MagicMock, patch
 
-from mirascope.core.base._utils._format_template import format_template
+from mirascope.core.base._utils._format_template import (
+    _parse_template,
+    format_template,
+)
 
 
 @patch(
@@ -17,6 +20,7 @@ def test_format_template(
     mock_get_template_variables: MagicMock, mock_get_template_values: MagicMock
 ) -> None:
     """Tests the `format_template` function."""
+    _parse_template.cache_clear()
     mock_get_template_variables.return_value = [("genre", None)]
     attrs = {"genre": "fantasy"}
     mock_get_template_values.return_value = attrs
@@ -31,6 +35,11 @@ def test_format_template(
     )
     mock_get_template_values.assert_called_once_with([("genre", None)], attrs)
 
+    # The parsed template is cached, so formatting it again doesn't re-parse it.
+    assert format_template(template, attrs) == "Recommend a fantasy book."
+    mock_get_template_variables.assert_called_once()
+    _parse_template.cache_clear()
+
 
 def test_format_template_with_none_attrs() -> None:
     """Tests the `format_template` function with `None` template variables."""
@@ -1,6 +1,19 @@
 """Tests the `_utils.json_mode_content` module."""
 
-from mirascope.core.base._utils._json_mode_content import json_mode_content
+import gc
+import json
+import weakref
+from unittest.mock import MagicMock, patch
+
+from openai.types.chat import ChatCompletion, ChatCompletionMessage
+from openai.types.chat.chat_completion import Choice
+from pydantic import BaseModel
+
+from mirascope.core import openai
+from mirascope.core.base._utils._json_mode_content import (
+    _json_mode_contents,
+    json_mode_content,
+)
 from mirascope.core.base.tool import BaseTool
 
 
@@ -31,3 +44,58 @@ Extract ONLY a valid JSON dict (NOT THE SCHEMA) from the content that adheres to
   "type": "object"
 }"""
     )
+
+
+def test_json_mode_content_is_cached() -> None:
+    """Tests that the schema is only rendered once per tool type, held weakly."""
+
+    class Book(BaseTool):
+        title: str
+
+    content = json_mode_content(Book)
+    assert json_mode_content(Book) is content
+    assert Book in _json_mode_contents
+
+    book_ref = weakref.ref(Book)
+    del Book
+    gc.collect()
+    assert book_ref() is None
+
+
+@patch("mirascope.core.openai._utils._setup_call.OpenAI", new_callable=MagicMock)
+def test_json_mode_content_cached_across_calls(mock_openai: MagicMock) -> None:
+    """Tests that json mode extraction calls reuse the rendered content."""
+
+    class Book(BaseModel):
+        title: str
+
+    create = mock_openai.return_value.chat.completions.create
+    create.return_value = ChatCompletion(
+        id="id",
+        choices=[
+            Choice(
+                finish_reason="stop",
+                index=0,
+                message=ChatCompletionMessage(
+                    content='{"title": "The Name of the Wind"}', role="assistant"
+                ),
+            )
+        ],
+        created=0,
+        model="gpt-4o-mini",
+        object="chat.completion",
+    )
+
+    @openai.call("gpt-4o-mini", response_model=Book, json_mode=True)
+    def extract_book(text: str) -> str:
+        return f"Extract {text}"
+
+    with patch(
+        "mirascope.core.base._utils._json_mode_content.json.dumps", wraps=json.dumps
+    ) as mock_dumps:
+        for _ in range(3):
+            extract_book("The Name of the Wind")
+    mock_dumps.assert_called_once()
+    assert create.call_args.kwargs["messages"][-1]["content"].startswith(
+        "Extract ONLY a valid JSON dict (NOT THE SCHEMA)"
+    )
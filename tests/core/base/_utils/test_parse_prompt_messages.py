@@ -1,10 +1,14 @@
 """Tests the `_utils.parse_prompt_messages` function."""
 
+from collections import deque
 from unittest.mock import MagicMock, call, patch
 
 import pytest
 
-from mirascope.core.base._utils._parse_prompt_messages import parse_prompt_messages
+from mirascope.core.base._utils._parse_prompt_messages import (
+    _split_template,
+    parse_prompt_messages,
+)
 
 
 @patch(
@@ -70,3 +74,37 @@ def test_parse_prompt_messages_invalid_messages() -> None:
             template="MESSAGES: {messages}",
             attrs={"messages": "not a list"},
         )
+
+
+def test_parse_prompt_messages_caches_template_split() -> None:
+    """Test that a template's role segments are only parsed once."""
+    _split_template.cache_clear()
+    template = "SYSTEM: You are a librarian. MESSAGES: {history} USER: {query}"
+    history = [{"role": "user", "content": "Hi"}]
+    for query in ["first", "second"]:
+        messages = parse_prompt_messages(
+            roles=["system", "user"],
+            template=template,
+            attrs={"history": history, "query": query},
+        )
+        assert [message.role for message in messages[::2]] == ["system", "user"]
+        assert messages[1] == history[0]
+        assert messages[2].content == query
+    cache_info = _split_template.cache_info()
+    assert cache_info.misses == 1
+    assert cache_info.hits == 1
+
+
+def test_parse_prompt_messages_deque_history() -> None:
+    """Test that `MESSAGES` accepts a bounded `deque` of messages."""
+    history = deque(
+        [{"role": "user", "content": str(i)} for i in range(4)],
+        maxlen=2,
+    )
+    messages = parse_prompt_messages(
+        roles=["user"], template="MESSAGES: {history}", attrs={"history": history}
+    )
+    assert messages == [
+        {"role": "user", "content": "2"},
+        {"role": "user", "content": "3"},
+    ]
@@ -1,15 +1,46 @@
 """Tests the `_utils.setup_call` function."""
 
 from typing import cast
+from unittest.mock import MagicMock, patch
 
 import pytest
+from openai.types.chat import ChatCompletion, ChatCompletionMessage
+from openai.types.chat.chat_completion import Choice
+from pydantic import BaseModel
 
+from mirascope.core import openai
 from mirascope.core.base import BaseCallParams, CommonCallParams
-from mirascope.core.base._utils._setup_call import setup_call
+from mirascope.core.base._utils._setup_call import _convert_tool, setup_call
 from mirascope.core.base.dynamic_config import BaseDynamicConfig
 from mirascope.core.base.message_param import BaseMessageParam
 from mirascope.core.base.prompt import prompt_template
 from mirascope.core.base.tool import BaseTool
+from mirascope.core.base.toolkit import BaseToolKit, toolkit_tool
+
+
+class _FormatBook(BaseTool):
+    title: str
+    author: str
+
+    def call(self) -> None:
+        """Format book tool call method."""
+
+    @classmethod
+    def tool_schema(cls):
+        return {"type": "function", "name": cls._name()}
+
+
+def _format_book(title: str, author: str) -> None:
+    """Format book tool."""
+
+
+class _BookToolKit(BaseToolKit):
+    reading_level: str
+
+    @toolkit_tool
+    def recommend_book(self, title: str) -> str:
+        """Recommends {title} at {self.reading_level} reading level."""
+        return title  # pragma: no cover
 
 
 def test_setup_call() -> None:
@@ -307,3 +338,85 @@ def test_setup_call_with_empty_common_params() -> None:
     ]
     assert tool_types is None
     assert call_kwargs == {}
+
+
+def test_setup_call_caches_tools() -> None:
+    """Tests that tools are only converted once per tool object across calls."""
+
+    class LocalFormatBook(_FormatBook): ...
+
+    @prompt_template("Recommend a book.")
+    def fn() -> None: ...  # pragma: no cover
+
+    def convert_common_call_params(common_params: CommonCallParams) -> BaseCallParams:
+        """Test conversion function for common parameters."""
+        return cast(BaseCallParams, common_params)
+
+    def _setup_call() -> tuple:
+        # Toolkits generate new tool classes per instance, so each is converted anew.
+        toolkit_tools = _BookToolKit(reading_level="beginner").create_tools()
+        return setup_call(
+            fn,
+            {},
+            None,
+            [_FormatBook, _format_book, LocalFormatBook, *toolkit_tools],
+            _FormatBook,
+            {},
+            convert_common_call_params,  # pyright: ignore [reportArgumentType]
+        )
+
+    with patch(
+        "mirascope.core.base._utils._setup_call._convert_tool", wraps=_convert_tool
+    ) as mock_convert_tool:
+        _, _, first_tool_types, first_call_kwargs = _setup_call()
+        _, _, second_tool_types, second_call_kwargs = _setup_call()
+    assert first_tool_types and second_tool_types
+    assert first_tool_types[:3] == second_tool_types[:3]
+    assert first_tool_types[3] is not second_tool_types[3]
+    assert first_call_kwargs == second_call_kwargs
+    assert second_call_kwargs["tools"] == [
+        {"type": "function", "name": "_FormatBook"},
+        {"type": "function", "name": "_format_book"},
+        {"type": "function", "name": "LocalFormatBook"},
+        {"type": "function", "name": "recommend_book"},
+    ]
+    # A subclass of a cached tool must not reuse its parent's conversion.
+    assert first_tool_types[2] is not first_tool_types[0]
+    assert mock_convert_tool.call_count == 5
+
+
+@patch("mirascope.core.openai._utils._setup_call.OpenAI", new_callable=MagicMock)
+def test_setup_call_caches_extract_tool(mock_openai: MagicMock) -> None:
+    """Tests that the `response_model` tool is only converted once across calls."""
+
+    class Book(BaseModel):
+        title: str
+
+    mock_openai.return_value.chat.completions.create.return_value = ChatCompletion(
+        id="id",
+        choices=[
+            Choice(
+                finish_reason="stop",
+                index=0,
+                message=ChatCompletionMessage(
+                    content='{"title": "The Name of the Wind"}', role="assistant"
+                ),
+            )
+        ],
+        created=0,
+        model="gpt-4o-mini",
+        object="chat.completion",
+    )
+
+    @openai.call("gpt-4o-mini", response_model=Book, json_mode=True)
+    def extract_book(text: str) -> str:
+        return f"Extract {text}"
+
+    with patch(
+        "mirascope.core.base._utils._setup_call._convert_tool", wraps=_convert_tool
+    ) as mock_convert_tool:
+        for _ in range(3):
+            assert extract_book("The Name of the Wind") == Book(
+                title="The Name of the Wind"
+            )
+    mock_convert_tool.assert_called_once()
@@ -151,3 +151,15 @@ def test_call_decorator_invalid_output_parser_with_stream(
         ValueError, match="Cannot use `output_parser` with `stream=True`"
     ):
         call("model", stream=True, output_parser=MagicMock())
+
+
+@patch("mirascope.core.base._call_factory.create_factory", new_callable=MagicMock)
+def test_call_factory_reuses_inner_decorator(
+    mock_create_factory: MagicMock, mock_call_factory_kwargs: dict
+) -> None:
+    """Tests that the inner decorator is only constructed once per `call_factory`."""
+    call = call_factory(**mock_call_factory_kwargs)
+    first = call("model")
+    second = call("other-model")
+    mock_create_factory.assert_called_once()
+    assert first.func is second.func  # pyright: ignore [reportAttributeAccessIssue]
@@ -0,0 +1,83 @@
+"""Tests the `parallel` module."""
+
+import asyncio
+import os
+import threading
+import time
+
+import pytest
+
+from mirascope.core import parallel
+
+
+def test_parallel_sync() -> None:
+    """Tests that synchronous functions run concurrently and preserve order."""
+    barrier = threading.Barrier(3, timeout=5)
+
+    def fn(value: int) -> int:
+        barrier.wait()  # only passes if all three calls are in flight at once
+        return value * 2
+
+    assert parallel(fn, [1, 2, 3]) == [2, 4, 6]
+    assert parallel(fn, []) == []
+
+
+def test_parallel_sync_max_concurrency() -> None:
+    """Tests that `max_concurrency` bounds the number of in-flight sync calls."""
+    lock = threading.Lock()
+    in_flight, peak = 0, 0
+
+    def fn(value: int) -> int:
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.01)
+        with lock:
+            in_flight -= 1
+        return value
+
+    assert parallel(fn, range(6), max_concurrency=2) == list(range(6))
+    assert peak <= 2
+
+
+def test_parallel_sync_default_max_concurrency() -> None:
+    """Tests that sync calls are bounded by the thread pool's default worker count."""
+    lock = threading.Lock()
+    threads: set[int] = set()
+
+    def fn(value: int) -> int:
+        with lock:
+            threads.add(threading.get_ident())
+        time.sleep(0.001)
+        return value
+
+    assert parallel(fn, range(100)) == list(range(100))
+    assert len(threads) <= min(32, (os.cpu_count() or 1) + 4)
+
+
+@pytest.mark.asyncio
+async def test_parallel_async() -> None:
+    """Tests that asynchronous functions are gathered and preserve order."""
+    in_flight, peak = 0, 0
+
+    async def fn(value: str) -> str:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return value.upper()
+
+    assert await parallel(fn, ["a", "b", "c"]) == ["A", "B", "C"]
+    assert peak == 3
+
+    peak = 0
+    assert await parallel(fn, ["a", "b", "c"], max_concurrency=1) == ["A", "B", "C"]
+    assert peak == 1
+
+
+def test_parallel_invalid_max_concurrency() -> None:
+    """Tests that a non-positive `max_concurrency` raises a `ValueError`."""
+    with pytest.raises(ValueError, match="`max_concurrency` must be at least 1."):
+        parallel(lambda value: value, [1], max_concurrency=0)
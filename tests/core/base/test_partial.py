@@ -92,3 +92,10 @@ def test_list_partial() -> None:
         partial(ModelWithList).model_json_schema()
         == PartialModelWithList.model_json_schema()
     )
+
+
+def test_partial_is_cached() -> None:
+    """Tests that the partial model is only generated once per class and fields."""
+    assert partial(ModelWithList) is partial(ModelWithList)
+    assert partial(ModelWithList, {"param"}) is partial(ModelWithList, {"param"})
+    assert partial(ModelWithList) is not partial(ModelWithList, {"param"})
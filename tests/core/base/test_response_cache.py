@@ -0,0 +1,288 @@
+"""Tests the `response_cache` decorator."""
+
+import asyncio
+from dataclasses import dataclass
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from openai.types.chat import (
+    ChatCompletion,
+    ChatCompletionMessage,
+    ChatCompletionMessageToolCall,
+)
+from openai.types.chat.chat_completion import Choice
+from openai.types.chat.chat_completion_message_tool_call import Function
+from pydantic import BaseModel
+
+from mirascope.core import openai, prompt_template
+from mirascope.core.base.response_cache import (
+    _ResponseCache,
+    cache_create,
+    cache_create_async,
+    claim_response_cache,
+    response_cache,
+)
+
+
+def test_response_cache_lru() -> None:
+    """Tests that the cache evicts the least recently used response."""
+    cache = _ResponseCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    cache.clear()
+    assert cache.get("a") is None
+
+
+def test_response_cache_key() -> None:
+    """Tests that the key depends on the model and the full request."""
+    key = _ResponseCache.key("model", {"messages": [{"content": "hi"}], "n": 1})
+    assert key == _ResponseCache.key("model", {"n": 1, "messages": [{"content": "hi"}]})
+    assert key != _ResponseCache.key("other", {"messages": [{"content": "hi"}], "n": 1})
+    assert key != _ResponseCache.key("model", {"messages": [{"content": "yo"}], "n": 1})
+
+
+def test_response_cache_key_serializes_by_content() -> None:
+    """Tests that equal SDK objects give the same key regardless of identity."""
+
+    class Format(BaseModel):
+        type: str
+
+    @dataclass
+    class Config:
+        temperature: float
+
+    class Part:
+        def __init__(self, text: str) -> None:
+            self.text = text
+
+        def to_dict(self) -> dict:
+            return {"text": self.text}
+
+    def kwargs(text: str) -> dict:
+        return {
+            "response_format": Format(type="json_object"),
+            "config": Config(temperature=0.5),
+            "parts": [Part(text)],
+            "stop": {"a", "b"},
+        }
+
+    assert _ResponseCache.key("model", kwargs("hi")) == _ResponseCache.key(
+        "model", kwargs("hi")
+    )
+    assert _ResponseCache.key("model", kwargs("hi")) != _ResponseCache.key(
+        "model", kwargs("yo")
+    )
+
+
+def test_response_cache_key_unserializable() -> None:
+    """Tests that requests with identity-based reprs can't be keyed."""
+    assert _ResponseCache.key("model", {"tool_config": object()}) is None
+
+
+def test_response_cache_unserializable_bypasses_cache() -> None:
+    """Tests that requests that can't be keyed are always sent to the provider."""
+    create = MagicMock(side_effect=lambda **kwargs: object())
+    tool_config = object()
+
+    @response_cache
+    def fn() -> object:
+        return cache_create(create, "model", claim_response_cache())(
+            stream=False, tool_config=tool_config
+        )
+
+    assert fn() is not fn()
+    assert create.call_count == 2
+
+
+def test_cache_create_inactive() -> None:
+    """Tests that `create` is returned as is outside of a cached call."""
+    create = MagicMock()
+    assert claim_response_cache() is None
+    assert cache_create(create, "model", None) is create
+    assert cache_create_async(create, "model", None) is create
+
+
+def test_response_cache_sync() -> None:
+    """Tests that repeated identical requests reuse the provider response."""
+    create = MagicMock(side_effect=lambda **kwargs: object())
+
+    @response_cache(maxsize=None)
+    def fn(content: str) -> object:
+        return cache_create(create, "model", claim_response_cache())(
+            stream=False, messages=[content]
+        )
+
+    first = fn("hi")
+    assert fn("hi") is first
+    assert fn("yo") is not first
+    assert create.call_count == 2
+
+    fn.cache_clear()  # pyright: ignore [reportFunctionMemberAccess]
+    assert fn("hi") is not first
+    assert create.call_count == 3
+
+    # The cache is only active for the duration of the decorated call.
+    assert claim_response_cache() is None
+
+
+def test_response_cache_async() -> None:
+    """Tests that repeated identical async requests reuse the provider response."""
+    create = AsyncMock(side_effect=lambda **kwargs: object())
+
+    @response_cache
+    async def fn(content: str) -> object:
+        return await cache_create_async(create, "model", claim_response_cache())(
+            stream=False, messages=[content]
+        )
+
+    async def run() -> None:
+        first = await fn("hi")
+        assert await fn("hi") is first
+        assert await fn("yo") is not first
+        assert create.await_count == 2
+
+    asyncio.run(run())
+
+
+def test_response_cache_async_unserializable_bypasses_cache() -> None:
+    """Tests that async requests that can't be keyed are always sent to the provider."""
+    create = AsyncMock(side_effect=lambda **kwargs: object())
+    tool_config = object()
+
+    @response_cache
+    async def fn() -> object:
+        return await cache_create_async(create, "model", claim_response_cache())(
+            stream=False, tool_config=tool_config
+        )
+
+    async def run() -> None:
+        assert await fn() is not await fn()
+        assert create.await_count == 2
+
+    asyncio.run(run())
+
+
+def _completion(
+    content: str | None = None, tool_call: ChatCompletionMessageToolCall | None = None
+) -> ChatCompletion:
+    return ChatCompletion(
+        id="id",
+        choices=[
+            Choice(
+                finish_reason="stop",
+                index=0,
+                message=ChatCompletionMessage(
+                    content=content,
+                    role="assistant",
+                    tool_calls=[tool_call] if tool_call else None,
+                ),
+            )
+        ],
+        created=0,
+        model="gpt-4o-mini",
+        object="chat.completion",
+    )
+
+
+@patch("mirascope.core.openai._utils._setup_call.OpenAI", new_callable=MagicMock)
+def test_response_cache_openai_call(mock_openai: MagicMock) -> None:
+    """Tests caching a real `openai.call` end to end."""
+    client = mock_openai.return_value
+    client.chat.completions.create.side_effect = lambda **kwargs: _completion(
+        kwargs["messages"][-1]["content"]
+    )
+
+    @response_cache
+    @openai.call("gpt-4o-mini")
+    def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+    first = recommend_book("fantasy")
+    second = recommend_book("fantasy")
+    assert second.content == first.content == "Recommend a fantasy book"
+    assert second.response is first.response
+    assert recommend_book("mystery").content == "Recommend a mystery book"
+    assert client.chat.completions.create.call_count == 2
+
+
+@patch("mirascope.core.openai._utils._setup_call.OpenAI", new_callable=MagicMock)
+def test_response_cache_openai_extract(mock_openai: MagicMock) -> None:
+    """Tests caching a real `openai.call` with a `response_model`."""
+
+    class Book(BaseModel):
+        title: str
+        author: str
+
+    client = mock_openai.return_value
+    client.chat.completions.create.return_value = _completion(
+        tool_call=ChatCompletionMessageToolCall(
+            id="id",
+            function=Function(
+                arguments='{"title": "The Name of the Wind", "author": "Rothfuss"}',
+                name="Book",
+            ),
+            type="function",
+        )
+    )
+
+    @response_cache
+    @openai.call("gpt-4o-mini", response_model=Book)
+    def extract_book(text: str) -> str:
+        return f"Extract {text}"
+
+    first = extract_book("The Name of the Wind by Rothfuss")
+    second = extract_book("The Name of the Wind by Rothfuss")
+    assert first == second == Book(title="The Name of the Wind", author="Rothfuss")
+    assert second is not first
+    assert client.chat.completions.create.call_count == 1
+
+
+@patch("mirascope.core.openai._utils._setup_call.OpenAI", new_callable=MagicMock)
+def test_response_cache_openai_nested_call(mock_openai: MagicMock) -> None:
+    """Tests that calls made while running a cached call don't use its cache."""
+    client = mock_openai.return_value
+    client.chat.completions.create.side_effect = lambda **kwargs: _completion("fantasy")
+
+    @openai.call("gpt-4o-mini")
+    def pick_genre() -> str:
+        return "Pick a genre"
+
+    @response_cache
+    @openai.call("gpt-4o-mini")
+    @prompt_template("Recommend a {genre} book")
+    def recommend_book() -> openai.OpenAIDynamicConfig:
+        return {"computed_fields": {"genre": pick_genre().content}}
+
+    first = recommend_book()
+    second = recommend_book()
+    assert second.response is first.response
+    # `pick_genre` isn't cached, so it's called again for the second `recommend_book`.
+    assert client.chat.completions.create.call_count == 3
+    pick_genre()
+    assert client.chat.completions.create.call_count == 4
+
+
+@patch("mirascope.core.openai._utils._setup_call.OpenAI", new_callable=MagicMock)
+def test_response_cache_openai_stream_nested_call(mock_openai: MagicMock) -> None:
+    """Tests that calls made while setting up a cached stream don't use its cache."""
+    client = mock_openai.return_value
+    client.chat.completions.create.side_effect = lambda **kwargs: _completion("fantasy")
+
+    @openai.call("gpt-4o-mini")
+    def pick_genre() -> str:
+        return "Pick a genre"
+
+    @response_cache
+    @openai.call("gpt-4o-mini", stream=True)
+    @prompt_template("Recommend a {genre} book")
+    def recommend_book() -> openai.OpenAIDynamicConfig:
+        return {"computed_fields": {"genre": pick_genre().content}}
+
+    recommend_book()
+    recommend_book()
+    # The streams themselves are never iterated, so only `pick_genre` is sent.
+    assert client.chat.completions.create.call_count == 2
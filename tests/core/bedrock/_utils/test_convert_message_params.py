@@ -5,6 +5,7 @@ import pytest
 from mirascope.core.base import (
     AudioPart,
     BaseMessageParam,
+    CacheControlPart,
     ImagePart,
     TextPart,
 )
@@ -27,6 +28,7 @@ def test_convert_message_params() -> None:
                 ImagePart(
                     type="image", media_type="image/jpeg", image=b"image", detail="auto"
                 ),
+                CacheControlPart(type="cache_control", cache_type="ephemeral"),
             ],
         ),
     ]
@@ -35,7 +37,11 @@ def test_convert_message_params() -> None:
         {"content": [{"text": "Hello", "type": "text"}], "role": "user"},
         {"content": [{"text": "Hello"}], "role": "user"},
         {
-            "content": [{"text": "Hello"}, {"bytes": b"image", "format": "image/jpeg"}],
+            "content": [
+                {"text": "Hello"},
+                {"bytes": b"image", "format": "image/jpeg"},
+                {"cachePoint": {"type": "default"}},
+            ],
             "role": "user",
         },
     ]
@@ -63,7 +69,8 @@ def test_convert_message_params() -> None:
 
     with pytest.raises(
         ValueError,
-        match="Bedrock currently only supports text and image parts. Part provided: audio",
+        match="Bedrock currently only supports text, image, and cache control parts. "
+        "Part provided: audio",
     ):
         convert_message_params(
             [
@@ -127,12 +127,15 @@ def test_setup_call_system_message(
     mock_utils: MagicMock, mock_base_setup_call: MagicMock
 ) -> None:
     mock_base_setup_call.return_value[1] = [
-        {"role": "system", "content": [{"text": "system test"}]},
+        {
+            "role": "system",
+            "content": [{"text": "system test"}, {"cachePoint": {"type": "default"}}],
+        },
         {"role": "user", "content": [{"text": "user test"}]},
     ]
     mock_utils.setup_call = mock_base_setup_call
     mock_base_setup_call.return_value[3] = {}
-    _, _, messages, _, _ = setup_call(
+    _, _, messages, _, call_kwargs = setup_call(
         model="anthropic.claude-v2",
         client=None,
         fn=MagicMock(),
@@ -146,6 +149,10 @@ def test_setup_call_system_message(
     )
     assert messages[0]["role"] == "user"
     assert messages[0]["content"] == [{"text": "user test"}]
+    assert call_kwargs["system"] == [  # pyright: ignore [reportTypedDictNotRequiredAccess]
+        {"text": "system test"},
+        {"cachePoint": {"type": "default"}},
+    ]
 
 
 @patch(
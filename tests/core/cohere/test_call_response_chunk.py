@@ -44,3 +44,14 @@ def test_cohere_call_response_chunk() -> None:
     assert call_response_chunk_finish.input_tokens == 1
     assert call_response_chunk_finish.output_tokens == 1
     assert call_response_chunk_finish.finish_reasons == ["COMPLETE"]
+
+
+def test_cohere_call_response_chunk_no_meta() -> None:
+    """Tests `CohereCallResponseChunk.usage` when the stream end has no meta."""
+    chunk_finish = StreamEndStreamedChatResponse(
+        finish_reason="COMPLETE",
+        response=NonStreamedChatResponse(generation_id="id", text="content"),
+    )
+    call_response_chunk_finish = CohereCallResponseChunk(chunk=chunk_finish)
+    assert call_response_chunk_finish.usage is None
+    assert call_response_chunk_finish.input_tokens is None
@@ -98,7 +98,7 @@ def test_setup_call_json_mode(
         {"role": "user", "parts": [{"type": "text", "text": "test"}]}
     ]
     mock_base_setup_call.return_value[-1]["tools"] = MagicMock()
-    mock_base_setup_call.return_value[-1]["generation_config"] = generation_config_type(
+    generation_config = generation_config_type(
         candidate_count=1,
         max_output_tokens=100,
         response_mime_type="application/xml",
@@ -108,6 +108,7 @@ def test_setup_call_json_mode(
         top_k=0,
         top_p=0,
     )
+    mock_base_setup_call.return_value[-1]["generation_config"] = generation_config
     mock_convert_message_params.side_effect = lambda x: x
     _, _, messages, _, call_kwargs = setup_call(
         model="gemini-1.5-flash",
@@ -134,6 +135,7 @@ def test_setup_call_json_mode(
         "top_k": 0,
         "top_p": 0,
     }
+    assert call_kwargs["generation_config"] is not generation_config
 
 
 @patch(
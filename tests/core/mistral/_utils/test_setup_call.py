@@ -2,6 +2,7 @@
 
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
 from mistralai import Chat, Mistral
 from mistralai.models import (
@@ -15,7 +16,7 @@ from mistralai.models import (
 from mirascope.core.mistral._utils._convert_common_call_params import (
     convert_common_call_params,
 )
-from mirascope.core.mistral._utils._setup_call import setup_call
+from mirascope.core.mistral._utils._setup_call import _get_default_client, setup_call
 from mirascope.core.mistral.tool import MistralTool
 
 
@@ -249,3 +250,42 @@ def test_setup_call_extract(
         stream=False,
     )
     assert "tool_choice" in call_kwargs and call_kwargs["tool_choice"] == "any"
+
+
+@patch("mirascope.core.mistral._utils._setup_call.Mistral", new_callable=MagicMock)
+def test_get_default_client(mock_mistral: MagicMock) -> None:
+    """Tests that the default client is shared across calls with the same key."""
+    _get_default_client.cache_clear()
+    client = _get_default_client("key")
+    assert _get_default_client("key") is client
+    mock_mistral.assert_called_once()
+    assert mock_mistral.call_args.kwargs["api_key"] == "key"
+    assert isinstance(mock_mistral.call_args.kwargs["client"], httpx.Client)
+    _get_default_client("other")
+    assert mock_mistral.call_count == 2
+    _get_default_client.cache_clear()
+
+
+@patch("mirascope.core.mistral._utils._setup_call.Mistral", new_callable=MagicMock)
+@patch("mirascope.core.mistral._utils._setup_call._utils", new_callable=MagicMock)
+@patch.dict("os.environ", {"MISTRAL_API_KEY": "key"})
+def test_setup_call_async_default_client(
+    mock_utils: MagicMock, mock_mistral: MagicMock, mock_base_setup_call: MagicMock
+) -> None:
+    """Tests that async calls don't share a client across event loops."""
+    mock_utils.setup_call = mock_base_setup_call
+    for _ in range(2):
+        setup_call(
+            model="mistral-large-latest",
+            client=None,
+            fn=AsyncMock(),
+            fn_args={},
+            dynamic_config=None,
+            tools=None,
+            json_mode=False,
+            call_params={},
+            extract=False,
+            stream=False,
+        )
+    assert mock_mistral.call_count == 2
+    mock_mistral.assert_called_with(api_key="key")
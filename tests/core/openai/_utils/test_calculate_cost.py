@@ -1,5 +1,7 @@
 """Tests the `openai._utils.calculate_cost` function."""
 
+import pytest
+
 from mirascope.core.openai._utils._calculate_cost import calculate_cost
 
 
@@ -8,3 +10,9 @@ def test_calculate_cost() -> None:
     assert calculate_cost(None, None, model="gpt-4o-mini") is None
     assert calculate_cost(1, 1, model="unknown") is None
     assert calculate_cost(1, 1, model="gpt-4o-mini") == 0.00000075
+    assert calculate_cost(2, 1, model="gpt-4o-mini", cached_tokens=1) == pytest.approx(
+        0.000000825
+    )
+    assert calculate_cost(2, 1, model="gpt-4", cached_tokens=1) == pytest.approx(
+        0.000012
+    )
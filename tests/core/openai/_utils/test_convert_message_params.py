@@ -92,17 +92,14 @@ def test_convert_message_params() -> None:
             ]
         )
 
-    with pytest.raises(
-        ValueError,
-        match="OpenAI currently only supports text, image and audio parts. Part provided: cache_control",
-    ):
-        convert_message_params(
-            [
-                BaseMessageParam(
-                    role="user",
-                    content=[
-                        CacheControlPart(type="cache_control", cache_type="ephemeral")
-                    ],
-                )
-            ]
-        )
+    assert convert_message_params(
+        [
+            BaseMessageParam(
+                role="user",
+                content=[
+                    TextPart(type="text", text="Hello"),
+                    CacheControlPart(type="cache_control", cache_type="ephemeral"),
+                ],
+            )
+        ]
+    ) == [{"role": "user", "content": [{"type": "text", "text": "Hello"}]}]
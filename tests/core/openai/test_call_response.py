@@ -11,12 +11,52 @@ from openai.types.chat.chat_completion_message_tool_call import (
     ChatCompletionMessageToolCall,
     Function,
 )
-from openai.types.completion_usage import CompletionUsage
+from openai.types.completion_usage import CompletionUsage, PromptTokensDetails
 
 from mirascope.core.openai.call_response import OpenAICallResponse
 from mirascope.core.openai.tool import OpenAITool
 
 
+def test_openai_call_response_cached_tokens() -> None:
+    """Tests the `OpenAICallResponse.cached_tokens` property and cached cost."""
+    usage = CompletionUsage(
+        completion_tokens=1,
+        prompt_tokens=4,
+        total_tokens=5,
+        prompt_tokens_details=PromptTokensDetails(cached_tokens=2),
+    )
+    completion = ChatCompletion(
+        id="id",
+        choices=[
+            Choice(
+                finish_reason="stop",
+                index=0,
+                message=ChatCompletionMessage(content="content", role="assistant"),
+            )
+        ],
+        created=0,
+        model="gpt-4o",
+        object="chat.completion",
+        usage=usage,
+    )
+    call_response = OpenAICallResponse(
+        metadata={},
+        response=completion,
+        tool_types=None,
+        prompt_template="",
+        fn_args={},
+        dynamic_config=None,
+        messages=[],
+        call_params={},
+        call_kwargs={},
+        user_message_param=None,
+        start_time=0,
+        end_time=0,
+    )
+    assert call_response.cached_tokens == 2
+    assert call_response.cost == pytest.approx(1.75e-05)
+
+
 def test_openai_call_response() -> None:
     """Tests the `OpenAICallResponse` class."""
     choices = [
@@ -57,6 +97,7 @@ def test_openai_call_response() -> None:
     assert call_response.usage == usage
     assert call_response.input_tokens == 1
     assert call_response.output_tokens == 1
+    assert call_response.cached_tokens is None
     assert call_response.cost == 1.25e-05
     assert call_response.message_param == {
         "content": "content",
@@ -137,6 +178,74 @@ def test_openai_call_response_with_tools() -> None:
         tool = call_response.tools
 
 
+def test_openai_call_response_with_multiple_tools() -> None:
+    """Tests that `tools` matches each tool call to its tool type by name."""
+
+    class FormatBook(OpenAITool):
+        title: str
+
+        def call(self) -> str:
+            return self.title
+
+    class FormatAuthor(OpenAITool):
+        name: str
+
+        def call(self) -> str:
+            return self.name
+
+    tool_calls = [
+        ChatCompletionMessageToolCall(
+            id=f"id{i}",
+            function=Function(arguments=arguments, name=name),
+            type="function",
+        )
+        for i, (name, arguments) in enumerate(
+            [
+                ("FormatAuthor", '{"name": "Patrick Rothfuss"}'),
+                ("Unknown", "{}"),
+                ("FormatBook", '{"title": "The Name of the Wind"}'),
+            ]
+        )
+    ]
+    completion = ChatCompletion(
+        id="id",
+        choices=[
+            Choice(
+                finish_reason="tool_calls",
+                index=0,
+                message=ChatCompletionMessage(
+                    content=None, role="assistant", tool_calls=tool_calls
+                ),
+            )
+        ],
+        created=0,
+        model="gpt-4o",
+        object="chat.completion",
+    )
+    call_response = OpenAICallResponse(
+        metadata={},
+        response=completion,
+        tool_types=[FormatBook, FormatAuthor],
+        prompt_template="",
+        fn_args={},
+        dynamic_config=None,
+        messages=[],
+        call_params={},
+        call_kwargs={},
+        user_message_param=None,
+        start_time=0,
+        end_time=0,
+    )
+    tools = call_response.tools
+    assert tools is not None
+    assert [type(tool) for tool in tools] == [FormatAuthor, FormatBook]
+    assert isinstance(call_response.tool, FormatAuthor)
+    assert call_response._tool_types_by_name == {
+        "FormatBook": FormatBook,
+        "FormatAuthor": FormatAuthor,
+    }
+
+
 def test_openai_call_response_with_audio() -> None:
     """Tests the `OpenAICallResponse` class with audio content."""
     audio_data = b"fake audio data"
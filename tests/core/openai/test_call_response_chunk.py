@@ -48,6 +48,7 @@ def test_openai_call_response_chunk() -> None:
     assert call_response_chunk.usage == usage
     assert call_response_chunk.input_tokens == 1
     assert call_response_chunk.output_tokens == 1
+    assert {"content", "finish_reasons", "usage"} <= call_response_chunk.__dict__.keys()
 
 
 def test_openai_call_response_chunk_no_choices_or_usage() -> None:
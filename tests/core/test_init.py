@@ -0,0 +1,37 @@
+"""Tests the lazy provider imports in `mirascope.core`."""
+
+import sys
+from unittest.mock import patch
+
+import pytest
+
+import mirascope.core
+
+
+def test_lazy_provider_import() -> None:
+    """Tests that provider modules are imported on first attribute access."""
+    assert mirascope.core.openai is sys.modules["mirascope.core.openai"]
+
+
+def test_lazy_provider_import_missing_sdk() -> None:
+    """Tests that a provider whose SDK is missing surfaces as an `AttributeError`."""
+    with (
+        patch.dict(mirascope.core.__dict__),
+        patch("mirascope.core.import_module", side_effect=ImportError("missing sdk")),
+    ):
+        mirascope.core.__dict__.pop("groq", None)
+        assert not hasattr(mirascope.core, "groq")
+
+
+def test_unknown_attribute() -> None:
+    """Tests that unknown attributes still raise an `AttributeError`."""
+    with pytest.raises(AttributeError, match="no_such_provider"):
+        mirascope.core.no_such_provider  # noqa: B018  # pyright: ignore [reportAttributeAccessIssue]
+
+
+def test_dir() -> None:
+    """Tests that `dir` lists lazily imported names alongside the module globals."""
+    assert "openai" in dir(mirascope.core)
+    assert set(mirascope.core.__all__) <= set(dir(mirascope.core))
+    assert {"__name__", "__file__", "__getattr__"} <= set(dir(mirascope.core))
+    assert dir(mirascope.core) == sorted(dir(mirascope.core))
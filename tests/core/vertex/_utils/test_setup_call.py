@@ -1,6 +1,7 @@
 """Tests the `vertex._utils.setup_call` module."""
 
-from unittest.mock import MagicMock, patch
+from collections.abc import Generator
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from vertexai.generative_models import (
@@ -14,10 +15,27 @@ from vertexai.generative_models import (
 from mirascope.core.vertex._utils._convert_common_call_params import (
     convert_common_call_params,
 )
-from mirascope.core.vertex._utils._setup_call import setup_call
+from mirascope.core.vertex._utils._setup_call import (
+    _get_cached_client,
+    _get_default_client,
+    setup_call,
+)
 from mirascope.core.vertex.tool import VertexTool
 
 
+@pytest.fixture(autouse=True)
+def mock_global_config() -> Generator[MagicMock, None, None]:
+    """Patches the Vertex AI global config and resets the default client cache."""
+    _get_cached_client.cache_clear()
+    with patch(
+        "mirascope.core.vertex._utils._setup_call.aiplatform_initializer"
+    ) as mock_initializer:
+        mock_initializer.global_config.project = "project"
+        mock_initializer.global_config.location = "us-central1"
+        yield mock_initializer.global_config
+    _get_cached_client.cache_clear()
+
+
 @pytest.fixture()
 def mock_base_setup_call() -> MagicMock:
     """Returns the mock setup_call function."""
@@ -177,3 +195,48 @@ def test_setup_call_extract(
     ]._gapic_tool_config.function_calling_config
     assert function_calling_config.allowed_function_names == ["test"]
     assert function_calling_config.mode == function_calling_config.Mode.ANY
+
+
+@patch(
+    "mirascope.core.vertex._utils._setup_call.GenerativeModel", new_callable=MagicMock
+)
+def test_get_default_client(
+    mock_generative_model: MagicMock, mock_global_config: MagicMock
+) -> None:
+    """Tests that the default client is shared until the model or config changes."""
+    mock_generative_model.side_effect = lambda **kwargs: MagicMock()
+    client = _get_default_client("gemini-1.5-flash")
+    assert _get_default_client("gemini-1.5-flash") is client
+    mock_generative_model.assert_called_once_with(model_name="gemini-1.5-flash")
+
+    mock_global_config.location = "europe-west4"
+    assert _get_default_client("gemini-1.5-flash") is not client
+    assert mock_generative_model.call_count == 2
+
+
+@patch(
+    "mirascope.core.vertex._utils._setup_call.GenerativeModel", new_callable=MagicMock
+)
+@patch("mirascope.core.vertex._utils._setup_call._utils", new_callable=MagicMock)
+def test_setup_call_async_default_client(
+    mock_utils: MagicMock,
+    mock_generative_model: MagicMock,
+    mock_base_setup_call: MagicMock,
+) -> None:
+    """Tests that async calls don't share a client across event loops."""
+    mock_utils.setup_call = mock_base_setup_call
+    for _ in range(2):
+        setup_call(
+            model="gemini-1.5-flash",
+            client=None,
+            fn=AsyncMock(),
+            fn_args={},
+            dynamic_config=None,
+            tools=None,
+            json_mode=False,
+            call_params={},
+            extract=False,
+            stream=False,
+        )
+    assert mock_generative_model.call_count == 2
+    mock_generative_model.assert_called_with(model_name="gemini-1.5-flash")
@@ -0,0 +1,35 @@
+"""Tests the lazy tool imports in `mirascope.tools`."""
+
+import sys
+from unittest.mock import patch
+
+import pytest
+
+import mirascope.tools
+
+
+def test_lazy_tool_import() -> None:
+    """Tests that tool modules are imported on first attribute access."""
+    assert mirascope.tools.HTTPX is sys.modules["mirascope.tools.web._httpx"].HTTPX
+
+
+def test_lazy_tool_import_missing_dependency() -> None:
+    """Tests that a tool whose dependency is missing surfaces as an `AttributeError`."""
+    with patch(
+        "mirascope.tools.import_module", side_effect=ImportError("missing dependency")
+    ):
+        assert not hasattr(mirascope.tools, "DuckDuckGoSearch")
+
+
+def test_unknown_attribute() -> None:
+    """Tests that unknown attributes still raise an `AttributeError`."""
+    with pytest.raises(AttributeError, match="NoSuchTool"):
+        mirascope.tools.NoSuchTool  # noqa: B018  # pyright: ignore [reportAttributeAccessIssue]
+
+
+def test_dir() -> None:
+    """Tests that `dir` lists lazily imported names alongside the module globals."""
+    assert "HTTPX" in dir(mirascope.tools)
+    assert set(mirascope.tools.__all__) <= set(dir(mirascope.tools))
+    assert {"__name__", "__file__", "__getattr__"} <= set(dir(mirascope.tools))
+    assert dir(mirascope.tools) == sorted(dir(mirascope.tools))